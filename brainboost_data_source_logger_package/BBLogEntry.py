@@ -1,11 +1,15 @@
 # BBLogEntry.py
 
-import csv
-import io
 import json
+from typing import Optional
 from brainboost_configuration_package.BBConfig import BBConfig
 
 class BBLogEntry:
+    # No per-instance __dict__: one entry is allocated for every log call
+    __slots__ = ('timestamp', 'log_type', 'process', 'code_location', 'message', 'processing_time', 'config', '_str')
+
+    _delim: Optional[str] = None
+
     def __init__(self, process, timestamp, log_type, message, processing_time, code_location,config=None):
         self.timestamp = timestamp
         self.log_type = log_type
@@ -14,19 +18,48 @@ class BBLogEntry:
         self.message = message
         self.processing_time = processing_time
         self.config = config
+        self._str = None
 
-    def __str__(self):
-        # Use csv module to handle proper escaping
-        output = io.StringIO()
-        writer = csv.writer(output, delimiter=BBConfig.get('log_delimiter'), quotechar='"', quoting=csv.QUOTE_ALL)
-
-        writer.writerow([
+    def to_row(self):
+        """
+        Return the entry's values in log column order.
+        """
+        return (
             self.timestamp,
             self.log_type,
             self.process,
             self.code_location,
             self.message,
             self.processing_time
-        ])
-        return output.getvalue().strip()
+        )
+
+    def to_dict(self):
+        """
+        Return the entry as the JSON payload sent to notification endpoints.
+        """
+        return {
+            'timestamp': self.timestamp,
+            'log_type': self.log_type,
+            'process': self.process,
+            'code_location': self.code_location,
+            'message': self.message,
+            'processing_time': self.processing_time,
+            'config': self.config
+        }
+
+    def __str__(self):
+        if self._str is not None:
+            return self._str
+
+        d = BBLogEntry._delim
+        if d is None:
+            d = BBLogEntry._delim = BBConfig.get('log_delimiter')
 
+        # Same output as csv.writer with QUOTE_ALL. Only the message is free text; the other
+        # fields are timestamps, log types, process names, file:line and numbers without quotes.
+        message = str(self.message).replace('"', '""')
+        self._str = (
+            f'"{self.timestamp}"{d}"{self.log_type}"{d}"{self.process}"{d}'
+            f'"{self.code_location}"{d}"{message}"{d}"{self.processing_time}"'
+        )
+        return self._str
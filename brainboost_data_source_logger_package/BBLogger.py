@@ -1,21 +1,241 @@
 import os
+import re
 import sys
-import traceback
-from typing import Optional
+import queue
+import threading
+import time
+import atexit
+import io
+import mmap
+import numbers
+import struct
+from typing import Dict, List, Optional, Union
 import csv
 import requests
+import requests.adapters
 import sqlite3
 import pandas as pd
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 
+try:
+    import orjson
+except ImportError:  # optional, installed with the 'fast' extra
+    orjson = None
+
 from brainboost_data_source_logger_package.BBLogEntry import BBLogEntry  # Replace with actual import path
 from brainboost_configuration_package.BBConfig import BBConfig
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# (row number, byte offset) records of the '<log file>.idx' sidecar, one per data row
+_INDEX_RECORD = struct.Struct('<QQ')
+
+# Access pattern hints for mapped log files; madvise is not available on every platform
+_MADV_RANDOM = getattr(mmap, 'MADV_RANDOM', None)
+_MADV_SEQUENTIAL = getattr(mmap, 'MADV_SEQUENTIAL', None)
+
+# Batches at least this large skip the file buffer and go to the OS in one writev call
+_LOG_BUFFER_SIZE = 128 * 1024
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX <= 0:
+    # -1 means the limit is indeterminate; 16 is the POSIX minimum
+    _IOV_MAX = 16
+
+
+def _write_all(fd: int, chunks: list):
+    """
+    Write byte strings to a file descriptor in order, with as few system calls as possible.
+    """
+    if not hasattr(os, 'writev'):
+        data = memoryview(b''.join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    chunks = [memoryview(chunk) for chunk in chunks]
+    while chunks:
+        written = os.writev(fd, chunks[:_IOV_MAX])
+        # Drop the chunks that were written completely and resume within a partial one
+        done = 0
+        while done < len(chunks) and written >= len(chunks[done]):
+            written -= len(chunks[done])
+            done += 1
+        del chunks[:done]
+        if chunks and written:
+            chunks[0] = chunks[0][written:]
+
+
+@contextmanager
+def _file_lock(fd: int, exclusive: bool = True):
+    """
+    Hold an flock on a log file for the duration of the block.
+
+    Every process appending to a log file takes the exclusive lock around each write of rows
+    and their index records, so several processes can share one daily file. Without fcntl
+    (Windows) this does nothing, and a log file must have a single writer process.
+    """
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _AppendFile:
+    """
+    Append-only file written through an O_APPEND descriptor and one reusable buffer.
+
+    Unlike a buffered open(), no buffer is allocated per write, and data reaches the OS only
+    when the buffer fills, on flush() or on close().
+    """
+    __slots__ = ('name', '_fd', '_buffer', '_view', '_used')
+
+    def __init__(self, name: str, truncate: bool = False, buffer_size: int = _LOG_BUFFER_SIZE):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | (os.O_TRUNC if truncate else 0)
+        self.name = name
+        self._fd = os.open(name, flags | getattr(os, 'O_BINARY', 0), 0o644)
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def fits(self, size: int) -> bool:
+        """Whether size more bytes fit in the buffer."""
+        return self._used + size <= len(self._buffer)
+
+    def write(self, data: bytes):
+        if self._used + len(data) > len(self._buffer):
+            self.flush()
+            if len(data) >= len(self._buffer):
+                _write_all(self._fd, [data])
+                return
+        self._buffer[self._used:self._used + len(data)] = data
+        self._used += len(data)
+
+    def write_chunks(self, chunks: list):
+        """Write anything buffered and then the byte strings, with one writev where possible."""
+        if self._used:
+            chunks = [self._view[:self._used]] + list(chunks)
+        _write_all(self._fd, chunks)
+        self._used = 0
+
+    def flush(self):
+        if self._used:
+            _write_all(self._fd, [self._view[:self._used]])
+            self._used = 0
+
+    def discard(self):
+        """Close the file, dropping anything still in the buffer."""
+        self._used = 0
+        self.close()
+
+    def close(self):
+        if self._fd < 0:
+            return
+        try:
+            self.flush()
+        finally:
+            self._view.release()
+            os.close(self._fd)
+            self._fd = -1
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+_ERROR_RE = re.compile(r'error|exception|failed|missing', re.IGNORECASE)
+_WARNING_RE = re.compile(r'warning|aware|careful', re.IGNORECASE)
+# Keywords appear early in a message; don't scan the rest of a long traceback
+_CLASSIFY_SCAN_LIMIT = 512
+
+
+@lru_cache(maxsize=4096)
+def _classify_message(message: str) -> str:
+    # Repeated messages ("Connection failed") skip the scan entirely
+    if _ERROR_RE.search(message, 0, _CLASSIFY_SCAN_LIMIT):
+        return 'error'
+    if _WARNING_RE.search(message, 0, _CLASSIFY_SCAN_LIMIT):
+        return 'warning'
+    return 'message'
+
+
+@dataclass
+class _ConfigCache:
+    """
+    Snapshot of the BBConfig values read on every log call.
+    """
+    delimiter: str
+    path: str
+    prefix: str
+    columns: list
+    header_row: str
+    debug: bool
+    enable_files: bool
+    enable_database: bool
+    enable_terminal: bool
+    page_size: int
+    sqlite_path: str
+    insert_sql: str
+    batch_size: int
+    batch_interval: float
+    dedupe_window: float
+    dedupe_max_entries: int
+    background: bool
+
+    def log_file_path(self, date: str) -> str:
+        return os.path.join(self.path, f"{self.prefix}_log_{date}.log")
+
+
 class BBLogger:
     _process_name: Optional[str] = None
-    _last_time: Optional[datetime] = None
-    _delta: Optional[datetime] = None
+    _last_time: Optional[float] = None
+    _delta: Optional[float] = None
+    # (second, timestamp, day start, day end, uniform UTC offset, date prefix) of the last
+    # formatted second; replaced as a whole so threads never see a mix of two updates
+    _clock: tuple = (-1, '', 0, 0, True, '')
+    _conn: Optional[sqlite3.Connection] = None
+    _cfg: Optional[_ConfigCache] = None
+    _basenames: Dict[str, str] = {}
+    # (code object, line number, "file:line") of the most recent call site
+    _last_location: Optional[tuple] = None
+    _recent: 'OrderedDict[str, list]' = OrderedDict()
+    _session: Optional[requests.Session] = None
+    _notification_queue: queue.Queue = queue.Queue()
+    _notification_thread: Optional[threading.Thread] = None
+    _notification_lock = threading.Lock()
+    _notification_shutdown_timeout: float = 10.0
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_thread: Optional[threading.Thread] = None
+    _log_thread_lock = threading.Lock()
+    _worker_batch_size: int = 1024
+    _batch: list = []
+    _batch_started: Optional[float] = None
+    _log_file: Optional[_AppendFile] = None
+    _index_file: Optional[_AppendFile] = None
+    _log_file_day: Optional[str] = None
+    _log_writer = None
+    _row_buffer: Optional[io.StringIO] = None
+    # End of the log file and rows in its index as of this process's last write
+    _log_offset: int = 0
+    _log_rows: int = 0
+    # Lengths of the rows waiting in the log file's buffer, in order
+    _pending_lengths: list = []
+    _log_lock = threading.Lock()
+    # log file path -> (st_mtime_ns, st_size, data rows) of the last count
+    _row_counts: Dict[str, tuple] = {}
 
     @classmethod
     def _get_process_name(cls) -> str:
@@ -24,165 +244,930 @@ class BBLogger:
         return cls._process_name
 
     @classmethod
-    def _initialize_database(cls):
-        db_path = BBConfig.get('log_sqlite3_path')
-        if not os.path.exists(db_path):
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
+    def _format_timestamp(cls, now: float) -> str:
+        """
+        Format an epoch time as a local 'YYYYMMDDHHMMSS' timestamp.
+
+        The date part is rendered once per day and the full timestamp once per second;
+        in between only the time of day is computed, with integer arithmetic.
+        """
+        second = int(now)
+        clock = cls._clock
+        if second == clock[0]:
+            return clock[1]
+        day = clock[2:]
+        if not day[0] <= second < day[1]:
+            day = cls._start_day(second)
+
+        day_start, _, uniform, prefix = day
+        if uniform:
+            elapsed = second - day_start
+            timestamp = f"{prefix}{elapsed // 3600:02d}{elapsed // 60 % 60:02d}{elapsed % 60:02d}"
+        else:
+            # The UTC offset changes during this day (DST), so let the C library do it
+            timestamp = time.strftime('%Y%m%d%H%M%S', time.localtime(second))
+        cls._clock = (second, timestamp) + day
+        return timestamp
+
+    @staticmethod
+    def _start_day(second: int) -> tuple:
+        """
+        Return (day start, day end, uniform UTC offset, date prefix) of the local day of second.
+        """
+        tm = time.localtime(second)
+        day_start = int(time.mktime((tm.tm_year, tm.tm_mon, tm.tm_mday, 0, 0, 0, 0, 0, -1)))
+        day_end = int(time.mktime((tm.tm_year, tm.tm_mon, tm.tm_mday + 1, 0, 0, 0, 0, 0, -1)))
+        uniform = time.localtime(day_start).tm_gmtoff == time.localtime(day_end - 1).tm_gmtoff
+        return day_start, day_end, uniform, time.strftime('%Y%m%d', tm)
+
+    @classmethod
+    def _get_code_location(cls, frame) -> str:
+        # Logging tends to come from the same call site over and over; checking the last one
+        # first skips the lookup and formatting. One tuple keeps the check thread-safe.
+        code, lineno = frame.f_code, frame.f_lineno
+        last = cls._last_location
+        if last is not None and last[0] is code and last[1] == lineno:
+            return last[2]
+
+        # A code object's filename never changes, so its basename is computed once
+        filename = code.co_filename
+        basename = cls._basenames.get(filename)
+        if basename is None:
+            basename = cls._basenames[filename] = os.path.basename(filename)
+        location = f"{basename}:{lineno}"
+        cls._last_location = (code, lineno, location)
+        return location
+
+    @classmethod
+    def _get_setting(cls, key: str, default):
+        """
+        Read an optional configuration value, falling back to a default when it is not set.
+
+        :param key: The configuration key to read.
+        :param default: The value returned when the key is missing or empty.
+        :return: The configured value or the default.
+        """
+        try:
+            value = BBConfig.get(key)
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    @classmethod
+    def _config(cls) -> _ConfigCache:
+        """
+        Return the cached logger configuration, reading it from BBConfig on first use.
+        """
+        if cls._cfg is None:
             columns = BBConfig.get('log_columns')
-            columns_str = ", ".join([f"{col} TEXT" for col in columns])
-            cursor.execute(f"CREATE TABLE logs ({columns_str});")
-            conn.commit()
-            conn.close()
-
-    @classmethod
-    def _write_to_database(cls, log_entry: BBLogEntry):
-        db_path = BBConfig.get('log_sqlite3_path')
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        columns = BBConfig.get('log_columns')
-        cursor.execute(
-            f"INSERT INTO logs ({', '.join(columns)}) VALUES ({', '.join(['?' for _ in columns])});",
-            [
-                log_entry.timestamp,
-                log_entry.log_type,
-                log_entry.process,
-                log_entry.code_location,
-                log_entry.message,
-                log_entry.processing_time
-            ]
+            delimiter = BBConfig.get('log_delimiter')
+            cls._cfg = _ConfigCache(
+                delimiter=delimiter,
+                path=BBConfig.get('log_path'),
+                prefix=BBConfig.get('log_prefix'),
+                columns=columns,
+                header_row=delimiter.join(columns),
+                debug=BBConfig.get('log_debug_mode'),
+                enable_files=BBConfig.get('log_enable_files'),
+                enable_database=BBConfig.get('log_enable_database'),
+                enable_terminal=BBConfig.get('log_enable_terminal_output'),
+                page_size=BBConfig.get('log_page_size'),
+                sqlite_path=BBConfig.get('log_sqlite3_path'),
+                insert_sql=f"INSERT INTO logs ({', '.join(columns)}) VALUES ({', '.join(['?' for _ in columns])});",
+                batch_size=cls._get_setting('log_batch_size', 100),
+                batch_interval=cls._get_setting('log_batch_interval_sec', 1.0),
+                dedupe_window=cls._get_setting('log_dedupe_window_sec', 0),
+                dedupe_max_entries=cls._get_setting('log_dedupe_max_entries', 1024),
+                background=cls._get_setting('log_background_writer', True)
+            )
+        return cls._cfg
+
+    @classmethod
+    def refresh_config(cls):
+        """
+        Drop the cached configuration so the next call re-reads BBConfig.
+
+        Call this after BBConfig.override() once logging has started. Buffered rows are
+        flushed and the open log file and database are closed, since their paths may change.
+        """
+        cls.flush()
+        with cls._log_lock:
+            cls._close_log_file()
+        if cls._conn is not None:
+            cls._conn.close()
+            cls._conn = None
+        cls._cfg = None
+        BBLogEntry._delim = None
+
+    @classmethod
+    def _initialize_database(cls):
+        if cls._conn is not None:
+            return
+
+        cfg = cls._config()
+        db_path = cfg.sqlite_path
+        db_exists = os.path.exists(db_path)
+        cls._conn = sqlite3.connect(db_path, check_same_thread=False)
+        cls._conn.execute("PRAGMA journal_mode=WAL;")
+        cls._conn.execute("PRAGMA synchronous=NORMAL;")
+        cls._conn.execute("PRAGMA temp_store=MEMORY;")
+        cls._conn.execute("PRAGMA cache_size=-65536;")  # 64MB
+        cls._conn.execute("PRAGMA mmap_size=268435456;")  # 256MB
+
+        # No indexes while logging; finalize_day() adds the timestamp index in one pass
+        if not db_exists:
+            columns_str = ", ".join([f"{col} TEXT" for col in cfg.columns])
+            cls._conn.execute(f"CREATE TABLE logs ({columns_str});")
+            cls._conn.commit()
+
+    @classmethod
+    def _write_to_database_batch(cls, rows: list):
+        if not cls._batch:
+            cls._batch_started = time.monotonic()
+        cls._batch.extend(rows)
+
+        cfg = cls._config()
+        if len(cls._batch) >= cfg.batch_size or time.monotonic() - cls._batch_started >= cfg.batch_interval:
+            cls._flush_database()
+
+    @classmethod
+    def _flush_database(cls):
+        if cls._conn is None or not cls._batch:
+            return
+        try:
+            # A single transaction for the whole batch instead of one commit per row
+            with cls._conn:
+                # The statement string is built once, so sqlite3 reuses its prepared statement
+                cls._conn.executemany(cls._config().insert_sql, cls._batch)
+        except sqlite3.Error as e:
+            print(f'Failed to write to log database: {e}')
+        finally:
+            cls._batch.clear()
+
+    @classmethod
+    def finalize_day(cls):
+        """
+        Index the log database on timestamp once the bulk of a day's rows has been written.
+
+        Building the index once is much cheaper than maintaining it on every insert, so
+        call this at log rotation rather than before logging starts.
+        """
+        cfg = cls._config()
+        if not cfg.enable_database or 'timestamp' not in cfg.columns:
+            return
+        cls._initialize_database()
+        cls._flush_database()
+        try:
+            with cls._conn:
+                cls._conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs (timestamp);")
+        except sqlite3.Error as e:
+            print(f'Failed to index log database: {e}')
+
+    @classmethod
+    def _open_log_file(cls, current_date: str):
+        cls._close_log_file()
+        cfg = cls._config()
+        log_file_path = cfg.log_file_path(current_date)
+        index_file_path = log_file_path + '.idx'
+
+        cls._index_file = None
+        # One O_APPEND descriptor per day; rows reach the OS when its buffer fills or on flush()
+        cls._log_file = _AppendFile(log_file_path)
+        cls._log_file_day = current_date.replace('_', '')
+        cls._pending_lengths = []
+        cls._row_buffer = io.StringIO()
+        cls._log_writer = csv.writer(
+            cls._row_buffer,
+            delimiter=cfg.delimiter,
+            quotechar="'",
+            quoting=csv.QUOTE_MINIMAL
         )
-        conn.commit()
-        conn.close()
+
+        # Other processes may be opening the same file: whoever finds it empty writes the
+        # header. Rows written without the index (older versions, a crash between the two
+        # writes) are indexed first so appended records stay in step with the file.
+        fd = cls._log_file.fileno()
+        with _file_lock(fd):
+            if os.fstat(fd).st_size == 0:
+                cls._log_file.write_chunks([cls._encode_row(cfg.columns)])
+                cls._log_rows = 0
+                cls._index_file = _AppendFile(index_file_path, truncate=True, buffer_size=0)
+            else:
+                try:
+                    cls._log_rows = cls._update_index(log_file_path, index_file_path)
+                    # Records are only written under the lock, straight to the file
+                    cls._index_file = _AppendFile(index_file_path, buffer_size=0)
+                except OSError as e:
+                    print(f'Failed to update log index: {e}')
+            cls._log_offset = os.fstat(fd).st_size
+
+    @classmethod
+    def _close_log_file(cls):
+        if cls._log_file is None:
+            return
+        try:
+            cls._flush_log_file()
+            for handle in (cls._log_file, cls._index_file):
+                if handle is not None:
+                    os.fsync(handle.fileno())
+                    handle.close()
+        except (IOError, ValueError) as e:
+            print(f'Failed to close log file: {e}')
+        finally:
+            cls._log_file = None
+            cls._index_file = None
+            cls._log_file_day = None
+            cls._log_writer = None
+            cls._pending_lengths = []
 
     @classmethod
-    def _write_to_log_file(cls, log_entry: BBLogEntry):
-        current_date = cls._last_time.strftime('%Y_%m_%d')
-        log_file_path = os.path.join(BBConfig.get('log_path'), f"{BBConfig.get('log_prefix')}_log_{current_date}.log")
-        file_exists = os.path.isfile(log_file_path)
+    def _encode_row(cls, row) -> bytes:
+        cls._row_buffer.seek(0)
+        cls._row_buffer.truncate()
+        cls._log_writer.writerow(row)
+        return cls._row_buffer.getvalue().encode('utf-8')
 
+    @classmethod
+    def _append_rows(cls, chunks: list, size: int):
+        """
+        Buffer encoded rows for the open log file, writing everything out once the buffer is full.
+        """
+        if cls._log_file.fits(size):
+            cls._log_file.write(b''.join(chunks))
+            cls._pending_lengths.extend(map(len, chunks))
+        else:
+            # Large batches go out with the buffer in one writev call instead of being copied
+            cls._flush_log_file(chunks)
+
+    @classmethod
+    def _flush_log_file(cls, chunks: tuple = ()):
+        """
+        Write the buffered rows, then chunks, to the open log file and index them.
+
+        Offsets and row numbers are taken from the files under the lock, since other
+        processes may have appended since this one last wrote.
+        """
+        lengths = cls._pending_lengths
+        if chunks:
+            lengths = lengths + [len(chunk) for chunk in chunks]
+        if not lengths:
+            return
+        fd = cls._log_file.fileno()
+        with _file_lock(fd):
+            offset = os.fstat(fd).st_size
+            cls._log_file.write_chunks(chunks)
+            cls._pending_lengths = []
+            if cls._index_file is not None:
+                rows = os.fstat(cls._index_file.fileno()).st_size // _INDEX_RECORD.size
+                records = []
+                for length in lengths:
+                    rows += 1
+                    records.append(_INDEX_RECORD.pack(rows, offset))
+                    offset += length
+                cls._index_file.write_chunks([b''.join(records)])
+                cls._log_rows = rows
+            else:
+                offset += sum(lengths)
+            cls._log_offset = offset
+
+    @classmethod
+    def _write_to_log_file_batch(cls, rows: list):
         try:
-            with open(log_file_path, 'a+', encoding='utf-8', newline='') as log_file:
-                writer = csv.writer(
-                    log_file,
-                    delimiter=BBConfig.get('log_delimiter'),
-                    quotechar="'",
-                    quoting=csv.QUOTE_MINIMAL
-                )
-                if not file_exists:
-                    writer.writerow(BBConfig.get('log_columns'))
-                writer.writerow([
-                    log_entry.timestamp,
-                    log_entry.log_type,
-                    log_entry.process,
-                    log_entry.code_location,
-                    log_entry.message,
-                    log_entry.processing_time
-                ])
+            with cls._log_lock:
+                chunks, size = [], 0
+                for row in rows:
+                    # Rows carry their own 'YYYYMMDDHHMMSS' timestamp, so a batch may span midnight
+                    day = row[0][:8]
+                    if day != cls._log_file_day:
+                        if chunks:
+                            cls._append_rows(chunks, size)
+                            chunks, size = [], 0
+                        cls._open_log_file(f"{day[:4]}_{day[4:6]}_{day[6:]}")
+                    data = cls._encode_row(row)
+                    chunks.append(data)
+                    size += len(data)
+                if chunks:
+                    cls._append_rows(chunks, size)
         except IOError as e:
             print(f'Failed to write to log file: {e}')
 
     @classmethod
-    def get_page(cls, page_num: int) -> pd.DataFrame:
+    def _row_starts(cls, log_file, offset: int):
+        """
+        Yield the byte offset following each row terminator after offset in a binary log file.
+
+        :param log_file: Log file opened in binary mode.
+        :param offset: Start of a row to scan from.
+        """
+        log_file.seek(offset)
+        position = offset
+        in_quotes = False
+        for chunk in iter(lambda: log_file.read(1 << 20), b''):
+            start = 0
+            while True:
+                if in_quotes:
+                    # A newline inside a quoted message does not end the row; '' escapes
+                    # close and reopen the quotes
+                    quote = chunk.find(b"'", start)
+                    if quote < 0:
+                        break
+                    in_quotes = False
+                    start = quote + 1
+                    continue
+                newline = chunk.find(b'\n', start)
+                quote = chunk.find(b"'", start, newline if newline >= 0 else len(chunk))
+                if quote >= 0:
+                    in_quotes = True
+                    start = quote + 1
+                    continue
+                if newline < 0:
+                    break
+                yield position + newline + 1
+                start = newline + 1
+            position += len(chunk)
+
+    @classmethod
+    def _update_index(cls, log_file_path: str, index_file_path: str) -> int:
+        """
+        Bring a log file's offset index up to date with the rows in the log file.
+
+        Only rows after the last indexed one are scanned, so a missing index is built once
+        and an index that fell behind the log file is completed. The caller holds the log
+        file's lock, so no other process appends while the index is checked and extended.
+
+        :return: The number of data rows in the index.
+        """
+        rows = 0
+        start = 0  # Scanning from the top skips the header row
+        if os.path.isfile(index_file_path):
+            with open(index_file_path, 'r+b') as index_file:
+                size = os.fstat(index_file.fileno()).st_size
+                rows = size // _INDEX_RECORD.size
+                if size % _INDEX_RECORD.size:
+                    index_file.truncate(rows * _INDEX_RECORD.size)
+                if rows:
+                    index_file.seek((rows - 1) * _INDEX_RECORD.size)
+                    number, start = _INDEX_RECORD.unpack(index_file.read(_INDEX_RECORD.size))
+                    if number != rows:
+                        rows, start = 0, 0
+                        index_file.truncate(0)
+
+        records = []
+        with open(log_file_path, 'rb') as log_file:
+            size = os.fstat(log_file.fileno()).st_size
+            # An index pointing past the end of the file belongs to another file; start over
+            rebuild = start >= size
+            if rebuild:
+                rows, start = 0, 0
+            for offset in cls._row_starts(log_file, start):
+                if offset >= size:
+                    break
+                rows += 1
+                records.append(_INDEX_RECORD.pack(rows, offset))
+
+        with open(index_file_path, 'wb' if rebuild else 'ab') as index_file:
+            index_file.write(b''.join(records))
+        return rows
+
+    @classmethod
+    def _update_index_locked(cls, log_file_path: str) -> int:
+        """
+        Update the offset index of a log file while holding the file's lock.
+        """
+        with open(log_file_path, 'rb') as log_file, _file_lock(log_file.fileno()):
+            return cls._update_index(log_file_path, log_file_path + '.idx')
+
+    @classmethod
+    def _ensure_index(cls, log_file_path: str) -> bool:
+        """
+        Update the offset index of a log file that is not open for writing.
+
+        :return: Whether the index was updated; the writer keeps the open file's index current.
+        """
+        with cls._log_lock:
+            if cls._log_file is not None and cls._log_file.name == log_file_path:
+                return False
+            try:
+                cls._update_index_locked(log_file_path)
+                return True
+            except OSError as e:
+                print(f'Failed to update log index: {e}')
+                return False
+
+    @classmethod
+    def _indexed_rows(cls, log_file_path: str) -> Optional[int]:
+        """
+        Return the number of data rows in a log file from its offset index.
+
+        :return: The row count, or None if the index is not maintained for the file.
+        """
+        with cls._log_lock:
+            if cls._log_file is not None and cls._log_file.name == log_file_path:
+                if cls._index_file is None:
+                    return None
+                # The row count from this process's last write holds only if nothing is
+                # buffered and no other process has appended since
+                if not cls._pending_lengths and os.fstat(cls._log_file.fileno()).st_size == cls._log_offset:
+                    return cls._log_rows
+            try:
+                return cls._update_index_locked(log_file_path)
+            except OSError as e:
+                print(f'Failed to update log index: {e}')
+                return None
+
+    @classmethod
+    def _row_offset(cls, log_file_path: str, row_number: int) -> Optional[int]:
+        """
+        Look up the byte offset of a data row in the log file's offset index.
+
+        :param log_file_path: Path of the log file.
+        :param row_number: The 1-based data row number.
+        :return: The byte offset of the row, or None if the index cannot answer.
+        """
+        index_file_path = log_file_path + '.idx'
+        if row_number < 1 or not os.path.isfile(index_file_path):
+            return None
+        # A plain read rather than a mapping: the index may be rebuilt by another process
+        with open(index_file_path, 'rb') as index_file:
+            index_file.seek((row_number - 1) * _INDEX_RECORD.size)
+            record = index_file.read(_INDEX_RECORD.size)
+        if len(record) < _INDEX_RECORD.size:
+            return None
+        number, offset = _INDEX_RECORD.unpack(record)
+        return offset if number == row_number else None
+
+    @classmethod
+    def _read_log_rows(cls, log_file_path: str, skip: int, count: int, advice: Optional[int] = None,
+                       columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Parse a slice of data rows from a log file with the pandas C parser.
+
+        The offset index gives the byte range of the requested rows, which is sliced out of a
+        mapping of the log file. Without an index, the parser skips the header row written by
+        _open_log_file and the earlier rows.
+
+        :param log_file_path: Path of the log file to read.
+        :param skip: Number of data rows to skip after the header.
+        :param count: Maximum number of data rows to return.
+        :param advice: madvise hint for the mapping, e.g. _MADV_RANDOM for single pages.
+        :param columns: Log columns to return, in this order. Defaults to all configured columns.
+        :return: pandas DataFrame with one string column per requested log column.
+        """
+        offset = cls._row_offset(log_file_path, skip + 1)
+        if offset is None and cls._ensure_index(log_file_path):
+            offset = cls._row_offset(log_file_path, skip + 1)
+        if offset is None:
+            return cls._parse_log_rows(log_file_path, 1 + skip, count, columns)
+
+        # The row after the slice ends it; past the last indexed row the slice runs to EOF
+        end = cls._row_offset(log_file_path, skip + count + 1)
+        with open(log_file_path, 'rb') as log_file:
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                if advice is not None:
+                    log.madvise(advice, offset - offset % mmap.PAGESIZE)
+                raw = log[offset:end if end is not None else len(log)]
+        return cls._parse_log_rows(io.BytesIO(raw), 0, count, columns)
+
+    @classmethod
+    def _read_logs_between(cls, log_file_path: str, t1: str, t2: str) -> Optional[pd.DataFrame]:
+        """
+        Parse only the rows of a log file whose timestamps fall within [t1, t2].
+
+        Rows are written in timestamp order, so both ends of the range are found by binary
+        search over the offset index, comparing the timestamp at the start of each row.
+
+        :param log_file_path: Path of the log file to read.
+        :param t1: The start timestamp in 'YYYYMMDDHHMMSS' format.
+        :param t2: The end timestamp in 'YYYYMMDDHHMMSS' format.
+        :return: pandas DataFrame of the matching rows, or None if the file has no usable index.
+        """
+        cls._ensure_index(log_file_path)
+        index_file_path = log_file_path + '.idx'
+        if not os.path.isfile(index_file_path):
+            return None
+
+        low, high = t1.encode('ascii'), t2.encode('ascii')
+        # The shared lock keeps writers from appending, and the index from being rebuilt,
+        # while both files are mapped
+        with open(index_file_path, 'rb') as index_file, open(log_file_path, 'rb') as log_file, \
+                _file_lock(log_file.fileno(), exclusive=False):
+            rows = os.fstat(index_file.fileno()).st_size // _INDEX_RECORD.size
+            if not rows:
+                return None
+            with mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ) as index, \
+                    mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as log:
+
+                def offset(row):
+                    return _INDEX_RECORD.unpack_from(index, row * _INDEX_RECORD.size)[1]
+
+                def first_row_after(bound, inclusive):
+                    # First row whose timestamp is above bound, or not below it if inclusive
+                    lo, hi = 0, rows
+                    while lo < hi:
+                        mid = (lo + hi) // 2
+                        start = offset(mid)
+                        timestamp = log[start:start + len(bound)]
+                        if timestamp < bound or (not inclusive and timestamp == bound):
+                            lo = mid + 1
+                        else:
+                            hi = mid
+                    return lo
+
+                first = first_row_after(low, True)
+                last = first_row_after(high, False)
+                if first >= last:
+                    data = b''
+                else:
+                    data = log[offset(first):offset(last) if last < rows else len(log)]
+
+        cfg = cls._config()
+        if not data:
+            return pd.DataFrame(columns=cfg.columns)
+        return pd.read_csv(
+            io.BytesIO(data),
+            delimiter=cfg.delimiter,
+            quotechar="'",
+            encoding='utf-8',
+            header=None,
+            names=cfg.columns,
+            engine='c'
+        )
+
+    @classmethod
+    def _read_boundary_day(cls, date: str, t1: str, t2: str) -> Optional[pd.DataFrame]:
+        """
+        Read the rows of one day's log within [t1, t2], or return None to read the whole day.
+
+        :param date: The date of the log file in 'YYYYMMDD' format.
+        """
+        cls.flush()
+        log_file_path = cls._config().log_file_path(f"{date[:4]}_{date[4:6]}_{date[6:]}")
+        if not os.path.exists(log_file_path):
+            return None
+        try:
+            return cls._read_logs_between(log_file_path, t1, t2)
+        except (OSError, ValueError) as e:
+            print(f"Failed to search log index: {e}")
+            return None
+
+    @classmethod
+    def _parse_log_rows(cls, source, skiprows: int, count: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        cfg = cls._config()
+        # Columns left out of usecols are tokenized but never converted or stored
+        df = pd.read_csv(
+            source,
+            delimiter=cfg.delimiter,
+            quotechar="'",
+            encoding='utf-8',
+            header=None,
+            names=cfg.columns,
+            skiprows=skiprows,
+            nrows=count,
+            usecols=columns,
+            dtype=str,
+            keep_default_na=False,
+            engine='c'
+        )
+        return df[columns] if columns is not None else df
+
+    @classmethod
+    def _count_log_rows(cls, log_file_path: str) -> int:
+        """
+        Count the data rows of a log file without parsing them.
+
+        Newlines are counted with bytes.count over raw chunks. Only a quoted message can hold
+        a newline, so quote parity decides which newlines end a row; '' escapes toggle it twice.
+        The count is reused until the file's size or modification time changes.
+
+        Files with an offset index skip all of that: the index holds one record per row.
+        """
+        rows = cls._indexed_rows(log_file_path)
+        if rows is not None:
+            return rows
+
+        stat = os.stat(log_file_path)
+        cached = cls._row_counts.get(log_file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        rows = 0
+        in_quotes = False
+        last = b''
+        with open(log_file_path, 'rb') as log_file:
+            first_line = log_file.readline()
+            has_header = first_line.rstrip(b'\r\n') == cls._config().header_row.encode('utf-8')
+            log_file.seek(len(first_line) if has_header else 0)
+
+            for chunk in iter(lambda: log_file.read(1 << 20), b''):
+                last = chunk[-1:]
+                if not in_quotes and b"'" not in chunk:
+                    rows += chunk.count(b'\n')
+                    continue
+                parts = chunk.split(b"'")
+                rows += sum(part.count(b'\n') for part in parts[1 if in_quotes else 0::2])
+                if len(parts) % 2 == 0:
+                    in_quotes = not in_quotes
+
+        # A final row without a line terminator still counts
+        if last and last != b'\n':
+            rows += 1
+        cls._row_counts[log_file_path] = (stat.st_mtime_ns, stat.st_size, rows)
+        return rows
+
+    @classmethod
+    def _is_repeat(cls, log_entry: BBLogEntry, pending: list) -> bool:
+        """
+        Record a message for deduplication and tell whether it repeats one seen within
+        the last log_dedupe_window_sec seconds.
+
+        Repeats are counted instead of written. When the window expires, the record is
+        evicted or the logger is flushed, one summary row reports how often it repeated.
+        Summary rows are appended to pending so they keep their place in the output, stamped
+        with the entry that caused them so timestamps in the log file never go backwards.
+        """
+        cfg = cls._config()
+        now = time.monotonic()
+        message = log_entry.message
+        record = cls._recent.get(message)
+        if record is not None:
+            if now - record[1] <= cfg.dedupe_window:
+                record[0] += 1
+                record[2] = log_entry
+                return True
+            del cls._recent[message]
+            cls._emit_repeat_summary(record, pending, log_entry.timestamp)
+
+        # [repeat count, window start, latest entry]
+        cls._recent[message] = [0, now, log_entry]
+        if len(cls._recent) > cfg.dedupe_max_entries:
+            _, oldest = cls._recent.popitem(last=False)
+            cls._emit_repeat_summary(oldest, pending, log_entry.timestamp)
+        return False
+
+    @classmethod
+    def _emit_repeat_summary(cls, record: list, pending: list, timestamp: str):
+        count, _, last_entry = record
+        if not count:
+            return
+        pending.append((BBLogEntry(
+            process=last_entry.process,
+            timestamp=timestamp,
+            log_type=last_entry.log_type,
+            message=f"{last_entry.message} [repeated {count} times]",
+            processing_time=last_entry.processing_time,
+            code_location=last_entry.code_location
+        ), False, False, False))
+
+    @classmethod
+    def _send_notification(cls, url: str, payload: dict):
+        """
+        Queue a log entry payload for delivery to a notification endpoint.
+
+        The HTTP request is made by a background worker so the caller never waits on the network.
+        """
+        with cls._notification_lock:
+            if cls._notification_thread is None:
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                cls._session = requests.Session()
+                cls._session.mount('http://', adapter)
+                cls._session.mount('https://', adapter)
+                cls._notification_thread = threading.Thread(
+                    target=cls._notification_worker,
+                    name='BBLoggerNotifications',
+                    daemon=True
+                )
+                cls._notification_thread.start()
+        cls._notification_queue.put_nowait((url, payload))
+
+    @classmethod
+    def _notification_worker(cls):
+        while True:
+            item = cls._notification_queue.get()
+            if item is None:
+                return
+            url, payload = item
+            try:
+                # The pooled session keeps connections alive between notifications
+                if orjson is not None:
+                    response = cls._session.post(url, data=orjson.dumps(payload), headers=_JSON_HEADERS)
+                else:
+                    response = cls._session.post(url, json=payload)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                print(f"Failed to send log to {url}: {e}")
+
+    @classmethod
+    def _stop_notification_worker(cls):
+        """
+        Deliver the queued notifications before the interpreter exits, waiting at most
+        _notification_shutdown_timeout seconds.
+        """
+        if cls._notification_thread is None:
+            return
+        cls._notification_queue.put_nowait(None)
+        cls._notification_thread.join(timeout=cls._notification_shutdown_timeout)
+        cls._notification_thread = None
+
+    @classmethod
+    def _shutdown(cls):
+        """
+        Write and deliver everything logged before the interpreter exits.
+
+        The log writer is drained first, since the entries it still holds may queue
+        notifications of their own.
+        """
+        cls.flush()
+        cls._stop_notification_worker()
+
+    @classmethod
+    def _start_log_worker(cls):
+        with cls._log_thread_lock:
+            if cls._log_thread is None or not cls._log_thread.is_alive():
+                cls._log_thread = threading.Thread(target=cls._log_worker, name='BBLoggerWriter', daemon=True)
+                cls._log_thread.start()
+
+    @classmethod
+    def _reset_after_fork(cls):
+        """
+        Give a forked child its own writer state.
+
+        Only the forking thread survives a fork, so the writer and notification threads are
+        gone and the locks may be held by threads that no longer exist. Rows the parent still
+        had buffered or queued are the parent's to write; flushing the copies would write
+        them twice.
+        """
+        cls._log_thread = None
+        cls._log_thread_lock = threading.Lock()
+        cls._log_queue = queue.SimpleQueue()
+        cls._log_lock = threading.Lock()
+        cls._recent = OrderedDict()
+        cls._batch = []
+        cls._batch_started = None
+        cls._notification_thread = None
+        cls._notification_lock = threading.Lock()
+        cls._notification_queue = queue.Queue()
+        cls._session = None
+        for handle in (cls._log_file, cls._index_file):
+            if handle is not None:
+                try:
+                    handle.discard()
+                except OSError:
+                    pass
+        cls._log_file = None
+        cls._index_file = None
+        cls._log_file_day = None
+        cls._log_writer = None
+        cls._pending_lengths = []
+
+    @classmethod
+    def _log_worker(cls):
+        """
+        Drain the log queue, writing whatever has accumulated as one batch per sink.
+
+        Queue items are single entries from log() or lists of them from log_many(). Flush
+        requests are threading.Event markers placed on the queue by flush(); they are set once
+        every entry queued before them has been written.
+        """
+        log_queue = cls._log_queue
+        while True:
+            batch = [log_queue.get()]
+            try:
+                while len(batch) < cls._worker_batch_size:
+                    batch.append(log_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            items = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    cls._handle_safely(items)
+                    items = []
+                    cls._handle_safely(None)
+                    item.set()
+                elif isinstance(item, list):
+                    items.extend(item)
+                else:
+                    items.append(item)
+            cls._handle_safely(items)
+
+    @classmethod
+    def _handle_safely(cls, items: Optional[list]):
+        # The worker must survive a failing sink, otherwise flush() would wait forever
+        try:
+            if items is None:
+                cls._flush_sinks()
+            else:
+                cls._handle(items)
+        except Exception as e:
+            print(f'Failed to write log entries: {e}')
+
+    @classmethod
+    def flush(cls):
+        """
+        Push buffered log rows to the log file and the log database.
+
+        With the background writer, this waits until every entry logged before the call has
+        been written. Called automatically at interpreter exit and before reading logs back.
+        """
+        worker = cls._log_thread
+        if worker is not None and not worker.is_alive() and not cls._log_queue.empty():
+            # Entries queued for a writer that has died still have to be written
+            cls._start_log_worker()
+            worker = cls._log_thread
+        if worker is not None and worker.is_alive() and threading.current_thread() is not worker:
+            done = threading.Event()
+            cls._log_queue.put(done)
+            done.wait()
+            return
+        cls._flush_sinks()
+
+    @classmethod
+    def _flush_sinks(cls):
+        pending = []
+        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+        while cls._recent:
+            _, record = cls._recent.popitem(last=False)
+            cls._emit_repeat_summary(record, pending, timestamp)
+        cls._dispatch(pending)
+
+        if cls._log_file is not None:
+            try:
+                with cls._log_lock:
+                    cls._flush_log_file()
+            except IOError as e:
+                print(f'Failed to flush log file: {e}')
+        cls._flush_database()
+
+    @classmethod
+    def get_page(cls, page_num: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Retrieve a specific page of log entries from today's log file as a pandas DataFrame.
 
         :param page_num: The page number to retrieve (1-based).
+        :param columns: Log columns to return, e.g. ['timestamp', 'message']. Defaults to all.
         :return: pandas DataFrame containing log entries for the specified page.
         :raises FileNotFoundError: If today's log file does not exist.
         :raises ValueError: If the page number is invalid.
         """
+        cls.flush()
+
+        cfg = cls._config()
+
         # Retrieve page size from configuration
-        page_size = BBConfig.get('log_page_size')
+        page_size = cfg.page_size
         
         # Get today's date in 'YYYY_MM_DD' format
         current_date = datetime.now().strftime('%Y_%m_%d')
         
         # Construct the log file path
-        log_file_path = os.path.join(
-            BBConfig.get('log_path'),
-            f"{BBConfig.get('log_prefix')}_log_{current_date}.log"
-        )
+        log_file_path = cfg.log_file_path(current_date)
 
         # Check if the log file exists
         if not os.path.exists(log_file_path):
             raise FileNotFoundError(f"Log file for today does not exist: {log_file_path}")
 
         try:
-            # Open and read the log file
-            with open(log_file_path, 'r', encoding='utf-8') as log_file:
-                reader = csv.reader(
-                    log_file,
-                    delimiter=BBConfig.get('log_delimiter'),
-                    quotechar="'"
-                )
-                logs = list(reader)
+            # Let the C parser skip the header and earlier pages and read only this one
+            df = cls._read_log_rows(log_file_path, (page_num - 1) * page_size, page_size, _MADV_RANDOM, columns) if page_num >= 1 else None
 
-                # Extract headers if present
-                if logs and logs[0] == BBConfig.get('log_columns'):
-                    headers = logs[0]
-                    logs = logs[1:]
-                else:
-                    headers = BBConfig.get('log_columns')
+            # Validate page number; the full count is only needed to report the error
+            if df is None or df.empty:
+                total_pages = (cls._count_log_rows(log_file_path) + page_size - 1) // page_size  # Ceiling division
+                raise ValueError(f"Invalid page number: {page_num}. Total pages available: {total_pages}.")
 
-                total_logs = len(logs)
-                total_pages = (total_logs + page_size - 1) // page_size  # Ceiling division
-
-                # Validate page number
-                if page_num < 1 or page_num > total_pages:
-                    raise ValueError(f"Invalid page number: {page_num}. Total pages available: {total_pages}.")
-
-                # Calculate start and end indices for slicing
-                start_index = (page_num - 1) * page_size
-                end_index = start_index + page_size
-
-                # Slice the logs for the requested page
-                selected_logs = logs[start_index:end_index]
-
-                # Convert the selected logs to a pandas DataFrame
-                df = pd.DataFrame(selected_logs, columns=headers)
-                return df
+            return df
 
         except IOError as e:
             print(f"Failed to read log file: {e}")
             return pd.DataFrame()
 
     @classmethod
-    def get_logs_in_range(cls, date: str, start_line: int, end_line: int):
+    def get_logs_in_range(cls, date: str, start_line: int, end_line: int, columns: Optional[List[str]] = None):
         """
         Retrieve log lines for a given date within a specified range.
 
         :param date: The date of the log file in YYYY_MM_DD format.
         :param start_line: The starting line number (1-based, inclusive).
         :param end_line: The ending line number (inclusive).
+        :param columns: Log columns to return, e.g. ['timestamp', 'message']. Defaults to all.
         :return: Pandas DataFrame of log entries within the specified range.
         """
-        log_file_path = os.path.join(BBConfig.get('log_path'), f"{BBConfig.get('log_prefix')}_log_{date}.log")
+        cls.flush()
+        cfg = cls._config()
+        log_file_path = cfg.log_file_path(date)
 
         if not os.path.exists(log_file_path):
             raise FileNotFoundError(f"Log file for {date} does not exist: {log_file_path}")
 
         try:
-            with open(log_file_path, 'r', encoding='utf-8') as log_file:
-                reader = csv.reader(
-                    log_file,
-                    delimiter=BBConfig.get('log_delimiter'),
-                    quotechar="'"
-                )
-                logs = list(reader)
-
-                # Skip header row if it exists
-                if logs and logs[0] == BBConfig.get('log_columns'):
-                    headers = logs[0]
-                    logs = logs[1:]
-                else:
-                    headers = None
+            valid = 1 <= start_line <= end_line
+            df = cls._read_log_rows(log_file_path, start_line - 1, end_line - start_line + 1, _MADV_SEQUENTIAL, columns) if valid else None
 
-                if start_line < 1 or end_line > len(logs) or start_line > end_line:
-                    raise ValueError(f"Invalid range: start_line={start_line}, end_line={end_line}, total_lines={len(logs)}")
+            if df is None or len(df) < end_line - start_line + 1:
+                total_lines = cls._count_log_rows(log_file_path)
+                raise ValueError(f"Invalid range: start_line={start_line}, end_line={end_line}, total_lines={total_lines}")
 
-                selected_logs = logs[start_line - 1:end_line]
-                return pd.DataFrame(selected_logs, columns=headers)
+            return df
         except IOError as e:
             print(f"Failed to read log file: {e}")
             return pd.DataFrame()
@@ -197,14 +1182,16 @@ class BBLogger:
         :return: Total number of pages available.
         :raises Exception: If no logs are available for today and no date is provided.
         """
-        page_size = BBConfig.get('log_page_size')
+        cls.flush()
+        cfg = cls._config()
+        page_size = cfg.page_size
         if date is None:
             date = datetime.now().strftime('%Y_%m_%d')
             is_today = True
         else:
             is_today = False
 
-        log_file_path = os.path.join(BBConfig.get('log_path'), f"{BBConfig.get('log_prefix')}_log_{date}.log")
+        log_file_path = cfg.log_file_path(date)
 
         if not os.path.exists(log_file_path):
             if is_today:
@@ -213,21 +1200,9 @@ class BBLogger:
                 return 0  # Or you can choose to raise an exception for missing dates as well
 
         try:
-            with open(log_file_path, 'r', encoding='utf-8') as log_file:
-                reader = csv.reader(
-                    log_file,
-                    delimiter=BBConfig.get('log_delimiter'),
-                    quotechar="'"
-                )
-                logs = list(reader)
-
-                # Remove header row if it exists
-                if logs and logs[0] == BBConfig.get('log_columns'):
-                    logs = logs[1:]
-
-                total_entries = len(logs)
-                total_pages = (total_entries + page_size - 1) // page_size  # Ceiling division
-                return total_pages
+            total_entries = cls._count_log_rows(log_file_path)
+            total_pages = (total_entries + page_size - 1) // page_size  # Ceiling division
+            return total_pages
         except IOError as e:
             if is_today:
                 raise Exception("No logs available")
@@ -248,32 +1223,29 @@ class BBLogger:
         if not isinstance(date, str) or len(date) != 8 or not date.isdigit():
             raise ValueError("Date must be a string in 'YYYYMMDD' format, e.g., '20240110'.")
 
+        cls.flush()
+        cfg = cls._config()
+
         # Convert to 'YYYY_MM_DD'
         formatted_date = f"{date[:4]}_{date[4:6]}_{date[6:]}"
 
         # Construct log file path
-        log_file_path = os.path.join(
-            BBConfig.get('log_path'),
-            f"{BBConfig.get('log_prefix')}_log_{formatted_date}.log"
-        )
+        log_file_path = cfg.log_file_path(formatted_date)
 
         if not os.path.exists(log_file_path):
             raise FileNotFoundError(f"Log file for date {date} does not exist: {log_file_path}")
 
         try:
-            # Determine if the log file has a header
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline().strip()
-                has_header = first_line == ",".join(BBConfig.get('log_columns'))
-
-            # Read the log file into a pandas DataFrame
+            # _open_log_file writes the header row with every new file, so the first row is
+            # always replaced by the configured column names
             df = pd.read_csv(
                 log_file_path,
-                delimiter=BBConfig.get('log_delimiter'),
+                delimiter=cfg.delimiter,
                 quotechar="'",
                 encoding='utf-8',
-                header=0 if has_header else None,
-                names=BBConfig.get('log_columns') if not has_header else None
+                header=0,
+                names=cfg.columns,
+                engine='c'
             )
 
             return df
@@ -282,20 +1254,27 @@ class BBLogger:
             return pd.DataFrame()
         
     @classmethod
-    def get_logs_between_timestampt_and_timestampt(cls, t1: str, t2: str) -> pd.DataFrame:
+    def get_logs_between_timestampt_and_timestampt(cls, t1: Union[str, int], t2: Union[str, int]) -> pd.DataFrame:
         """
         Retrieve all log entries between two timestamps across multiple log files.
 
-        :param t1: The start timestamp in 'YYYYMMDDHHMMSS' format.
-        :param t2: The end timestamp in 'YYYYMMDDHHMMSS' format.
+        :param t1: The start timestamp in 'YYYYMMDDHHMMSS' format, or as epoch seconds.
+        :param t2: The end timestamp in 'YYYYMMDDHHMMSS' format, or as epoch seconds.
         :return: pandas DataFrame containing log entries between t1 and t2.
         :raises ValueError: If the timestamp formats are incorrect or t1 > t2.
         """
+        # Epoch seconds are rendered in local time, like log rows. Not through
+        # _format_timestamp: its cache belongs to the threads that are logging.
+        if isinstance(t1, numbers.Integral):
+            t1 = time.strftime('%Y%m%d%H%M%S', time.localtime(int(t1)))
+        if isinstance(t2, numbers.Integral):
+            t2 = time.strftime('%Y%m%d%H%M%S', time.localtime(int(t2)))
+
         # Validate and parse timestamps
         try:
             dt1 = datetime.strptime(t1, '%Y%m%d%H%M%S')
             dt2 = datetime.strptime(t2, '%Y%m%d%H%M%S')
-        except ValueError as ve:
+        except (TypeError, ValueError) as ve:
             raise ValueError("Timestamps must be in 'YYYYMMDDHHMMSS' format.") from ve
 
         if dt1 > dt2:
@@ -312,10 +1291,20 @@ class BBLogger:
 
         # Initialize list to collect DataFrames
         log_dfs = []
+        boundary_dates = {date_list[0], date_list[-1]}
         for date_str in date_list:
             try:
-                df = cls.read_logs_from_date(date_str)
-                log_dfs.append(df)
+                # Only the first and last day can hold rows outside [t1, t2]; their matching
+                # rows are located through the offset index instead of parsing the whole day
+                df = cls._read_boundary_day(date_str, t1, t2) if date_str in boundary_dates else None
+                if df is None:
+                    df = cls.read_logs_from_date(date_str)
+                    if date_str in boundary_dates and not df.empty:
+                        # Fixed-width 'YYYYMMDDHHMMSS' strings compare like the timestamps they encode
+                        timestamps = df['timestamp'].astype(str)
+                        df = df[(timestamps >= t1) & (timestamps <= t2)]
+                if not df.empty:
+                    log_dfs.append(df)
             except FileNotFoundError:
                 print(f"Log file for date {date_str} does not exist. Skipping.")
             except Exception as e:
@@ -325,74 +1314,131 @@ class BBLogger:
             print("No log entries found between the specified timestamps.")
             return pd.DataFrame()
 
-        # Concatenate all DataFrames
-        all_logs_df = pd.concat(log_dfs, ignore_index=True)
+        # Concatenate all DataFrames; every row is already within [t1, t2]
+        if len(log_dfs) == 1:
+            filtered_logs_df = log_dfs[0].reset_index(drop=True)
+        else:
+            filtered_logs_df = pd.concat(log_dfs, ignore_index=True)
 
         # Convert 'timestamp' to datetime
         try:
-            all_logs_df['timestamp'] = pd.to_datetime(all_logs_df['timestamp'], format='%Y%m%d%H%M%S')
+            filtered_logs_df['timestamp'] = pd.to_datetime(filtered_logs_df['timestamp'].astype(str), format='%Y%m%d%H%M%S')
         except Exception as e:
             print(f"Failed to convert 'timestamp' to datetime: {e}")
             return pd.DataFrame()
 
-        # Filter logs between t1 and t2
-        mask = (all_logs_df['timestamp'] >= dt1) & (all_logs_df['timestamp'] <= dt2)
-        filtered_logs_df = all_logs_df.loc[mask].reset_index(drop=True)
-
         return filtered_logs_df
 
         
     @classmethod
     def log(cls, message, telegram: bool = False, slack: bool = False, url_notification: bool = False):
-        if BBConfig.get('log_debug_mode'):
+        cfg = cls._config()
+        if not cfg.debug:
+            return
 
-            def is_error_message(message):
-                possible_error_words = ['error', 'exception', 'failed', 'missing']
-                return any(word in message.lower() for word in possible_error_words)
+        log_entry = cls._new_entry(message, cls._get_code_location(sys._getframe(1)))
+        cls._submit((log_entry, telegram, slack, url_notification))
 
-            def is_warning_message(message):
-                possible_warning_words = ['warning', 'aware', 'careful']
-                return any(word in message.lower() for word in possible_warning_words)
+    @classmethod
+    def log_many(cls, messages, telegram: bool = False, slack: bool = False, url_notification: bool = False):
+        """
+        Log several messages in one call, as if log() was called for each of them in turn.
 
-            log_type = 'error' if is_error_message(message) else 'warning' if is_warning_message(message) else 'message'
+        The entries reach the sinks together: one hand-off to the background writer, one
+        pass over the log file and one database batch.
 
-            cls._delta = datetime.now() - cls._last_time if cls._last_time else None
-            cls._last_time = datetime.now()
-            current_date = cls._last_time.strftime('%Y_%m_%d')
+        :param messages: Iterable of messages to log.
+        :param telegram: Send every message to the Telegram notification endpoint.
+        :param slack: Send every message to the Slack notification endpoint.
+        :param url_notification: Send every message to the notification URL.
+        """
+        cfg = cls._config()
+        if not cfg.debug:
+            return
 
-            stack = traceback.extract_stack()
-            caller = stack[-2] if len(stack) >= 2 else None
-            code_location = f"{os.path.basename(caller.filename)}:{caller.lineno}" if caller else 'Unknown'
+        code_location = cls._get_code_location(sys._getframe(1))
+        items = [
+            (cls._new_entry(message, code_location), telegram, slack, url_notification)
+            for message in messages
+        ]
+        if items:
+            cls._submit(items)
 
-            log_entry = BBLogEntry(
-                process=cls._get_process_name(),
-                timestamp=cls._last_time.strftime('%Y%m%d%H%M%S'),
-                log_type=log_type,
-                message=message,
-                processing_time=str(cls._delta.total_seconds()) if cls._delta else '0',
-                code_location=code_location
-            )
+    @classmethod
+    def _new_entry(cls, message, code_location: str) -> BBLogEntry:
+        log_type = _classify_message(message)
 
-            if BBConfig.get('log_enable_files'):
-                cls._write_to_log_file(log_entry)
+        now = time.time()
+        cls._delta = now - cls._last_time if cls._last_time else None
+        cls._last_time = now
+        timestamp = cls._format_timestamp(now)
 
-            if BBConfig.get('log_enable_terminal_output'):
-                print(log_entry)
+        return BBLogEntry(
+            process=cls._get_process_name(),
+            timestamp=timestamp,
+            log_type=log_type,
+            message=message,
+            processing_time=str(round(cls._delta, 6)) if cls._delta else '0',
+            code_location=code_location
+        )
 
-            if BBConfig.get('log_enable_database'):
-                cls._initialize_database()
-                cls._write_to_database(log_entry)
+    @classmethod
+    def _submit(cls, item):
+        """
+        Hand one (log_entry, telegram, slack, url_notification) item, or a list of them, to the sinks.
+        """
+        if cls._config().background:
+            # The caller only pays for building the entry; the worker thread does the I/O
+            if cls._log_thread is None or not cls._log_thread.is_alive():
+                cls._start_log_worker()
+            cls._log_queue.put(item)
+        else:
+            cls._handle(item if isinstance(item, list) else [item])
 
-            def send_notification(url, log_entry):
-                try:
-                    response = requests.post(url, json=log_entry.__dict__)
-                    response.raise_for_status()
-                except requests.RequestException as e:
-                    print(f"Failed to send log to {url}: {e}")
-
-            if telegram:
-                send_notification(BBConfig.get('log_notification_telegram'), log_entry)
-            if slack:
-                send_notification(BBConfig.get('log_notification_slack'), log_entry)
-            if url_notification:
-                send_notification(BBConfig.get('log_notification_url'), log_entry)
+    @classmethod
+    def _handle(cls, items: list):
+        cfg = cls._config()
+        if cfg.dedupe_window:
+            pending = []
+            for item in items:
+                if not cls._is_repeat(item[0], pending):
+                    pending.append(item)
+            items = pending
+        cls._dispatch(items)
+
+    @classmethod
+    def _dispatch(cls, items: list):
+        """
+        Write (log_entry, telegram, slack, url_notification) items to every enabled sink.
+        """
+        if not items:
+            return
+        cfg = cls._config()
+
+        # Build each row once and share it between the file and database sinks
+        rows = [item[0].to_row() for item in items]
+
+        if cfg.enable_files:
+            cls._write_to_log_file_batch(rows)
+
+        if cfg.enable_terminal:
+            for item in items:
+                print(item[0])
+
+        if cfg.enable_database:
+            cls._initialize_database()
+            cls._write_to_database_batch(rows)
+
+        for log_entry, telegram, slack, url_notification in items:
+            if telegram or slack or url_notification:
+                payload = log_entry.to_dict()
+                if telegram:
+                    cls._send_notification(BBConfig.get('log_notification_telegram'), payload)
+                if slack:
+                    cls._send_notification(BBConfig.get('log_notification_slack'), payload)
+                if url_notification:
+                    cls._send_notification(BBConfig.get('log_notification_url'), payload)
+
+atexit.register(BBLogger._shutdown)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=BBLogger._reset_after_fork)
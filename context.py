@@ -1,75 +1,323 @@
 import os
 import re
 from datetime import datetime
+import io
 import json
-from collections import defaultdict
+import mmap
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import argparse
 import shutil
 
+try:
+    import re2 as _import_re  # google-re2 matches in linear time; optional
+except ImportError:
+    _import_re = re
+
+try:
+    import orjson  # optional, several times faster than json for large sources
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _JSON_INDENT = b'  '
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects strings with lone surrogates, such as file names decoded from
+            # non-UTF-8 bytes; json escapes them as \udcXX, with the same layout
+            return json.dumps(obj, indent=2).encode('utf-8')
+else:
+    _JSON_INDENT = b'    '
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode('utf-8')
+
+# Extensions by language, in detection order; a few entries are whole file names
+_LANGUAGE_EXTENSIONS = (
+    ('python', ('.py',)),
+    ('javascript', ('.js', '.mjs', '.jsx')),
+    ('typescript', ('.ts', '.tsx')),
+    ('java', ('.java',)),
+    ('csharp', ('.cs', '.csproj')),
+    ('cpp', ('.cpp', '.hpp', '.h', '.cc')),
+    ('c', ('.c', '.h')),
+    ('ruby', ('.rb', '.erb', '.rake')),
+    ('php', ('.php', '.phtml', '.php3', '.php4', '.php5', '.phps')),
+    ('swift', ('.swift',)),
+    ('kotlin', ('.kt', '.kts')),
+    ('go', ('.go',)),
+    ('r', ('.R', '.r')),
+    ('perl', ('.pl', '.pm', '.t')),
+    ('bash', ('.sh', '.bash')),
+    ('html', ('.html', '.htm')),
+    ('css', ('.css', '.scss', '.sass', '.less')),
+    ('sql', ('.sql',)),
+    ('scala', ('.scala', '.sc')),
+    ('haskell', ('.hs', '.lhs')),
+    ('lua', ('.lua',)),
+    ('rust', ('.rs',)),
+    ('dart', ('.dart',)),
+    ('matlab', ('.m',)),
+    ('julia', ('.jl',)),
+    ('vb', ('.vb', '.vbs')),
+    ('asm', ('.asm', '.s')),
+    ('fsharp', ('.fs', '.fsi', '.fsx')),
+    ('groovy', ('.groovy', '.gvy', '.gy', '.gsh')),
+    ('erlang', ('.erl', '.hrl')),
+    ('elixir', ('.ex', '.exs')),
+    ('cobol', ('.cob', '.cbl')),
+    ('fortran', ('.f', '.for', '.f90', '.f95')),
+    ('ada', ('.adb', '.ads')),
+    ('prolog', ('.pl', '.pro', '.P')),
+    ('lisp', ('.lisp', '.lsp')),
+    ('scheme', ('.scm', '.ss')),
+    ('racket', ('.rkt',)),
+    ('verilog', ('.v', '.vh')),
+    ('vhdl', ('.vhdl', '.vhd')),
+    ('markdown', ('.md', '.markdown')),
+    ('vue', ('.vue',)),
+    ('svelte', ('.svelte',)),
+    ('json', ('.json',)),
+    ('yaml', ('.yaml', '.yml')),
+    ('xml', ('.xml',)),
+    ('git', ('.gitignore', '.gitattributes')),
+    ('cicd', ('.travis.yml', 'Jenkinsfile', '.circleci/config.yml', '.gitlab-ci.yml', 'azure-pipelines.yml'))
+)
+
+_FLAT_EXT_SET = frozenset(extension for _, extensions in _LANGUAGE_EXTENSIONS for extension in extensions)
+
+# Flat lookups for detect_programming_language. Built from the end so that the first
+# language listing an extension wins, as when the languages were tried in order.
+_EXT_TO_LANG = {
+    extension: language
+    for language, extensions in reversed(_LANGUAGE_EXTENSIONS)
+    for extension in extensions if extension.startswith('.')
+}
+_NAME_TO_LANG = {
+    extension: language
+    for language, extensions in reversed(_LANGUAGE_EXTENSIONS)
+    for extension in extensions if not extension.startswith('.')
+}
+
+# Import statement patterns by file extension, compiled once for every file scanned.
+# Multiline mode is set inline because re2.compile does not take re flags.
+_IMPORT_PATTERNS = {
+    extension: _import_re.compile('(?m)' + pattern)
+    for extension, pattern in {
+        ".py": r"^\s*(?:import|from)\s+([\w\.]+)",
+        ".js": r"^\s*import\s+.*?\s+from\s+['\"]([\w\-\/]+)['\"]",
+        ".java": r"^\s*import\s+([\w\.]+)",
+        ".cpp": r"^\s*#\s*include\s*<([\w\.\/]+)>",
+        ".c": r"^\s*#\s*include\s*<([\w\.\/]+)>",
+        ".cs": r"^\s*using\s+([\w\.]+)",
+        ".rb": r"^\s*require\s+['\"]([\w\/]+)['\"]",
+        ".php": r"^\s*use\s+([\w\\]+)",
+        ".go": r"^\s*import\s+['\"]([\w\/]+)['\"]",
+        ".rs": r"^\s*extern\s+crate\s+([\w_]+)",
+        ".dart": r"^\s*import\s+['\"]([\w\/]+)['\"]",
+        ".ts": r"^\s*import\s+.*?\s+from\s+['\"]([\w\-\/]+)['\"]",
+        ".swift": r"^\s*import\s+([\w]+)",
+        ".kt": r"^\s*import\s+([\w\.]+)"
+    }.items()
+}
+
+# Keyword each import pattern starts with after leading whitespace. Lines are tested with
+# str.startswith, in C, so the regex only runs on the few lines that can match.
+_IMPORT_PREFIXES = {
+    ".py": ("import", "from"),
+    ".js": ("import",),
+    ".java": ("import",),
+    ".cpp": ("#",),
+    ".c": ("#",),
+    ".cs": ("using",),
+    ".rb": ("require",),
+    ".php": ("use",),
+    ".go": ("import",),
+    ".rs": ("extern",),
+    ".dart": ("import",),
+    ".ts": ("import",),
+    ".swift": ("import",),
+    ".kt": ("import",)
+}
+
+
+def _extension(name):
+    # Suffix from the last '.', so dotfiles such as '.gitignore' are their own extension
+    dot = name.rfind('.')
+    return name[dot:] if dot >= 0 else ''
+
+
+# Sources above this size are memory-mapped and decoded in one step
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def _scan_lines(f_raw, regex, prefixes):
+    """
+    Decode a source file line by line, matching imports as the lines are read.
+
+    Every import pattern is anchored at the line start, so each line is matched on its own
+    instead of searching the whole content.
+
+    :return: Tuple of (content, line count, list of imports).
+    """
+    lines = []
+    imports = []
+    for line in io.TextIOWrapper(f_raw, encoding='utf-8'):
+        lines.append(line)
+        if regex is not None and line.lstrip().startswith(prefixes):
+            match = regex.match(line)
+            if match:
+                imports.append(match.group(1))
+    return ''.join(lines), len(lines), imports
+
+
+def _scan_mapped(f_raw, regex):
+    """
+    Decode a large source file straight from a memory map and search it for imports.
+
+    Decoding from the map skips the read buffers and the per-line strings; one findall over
+    the content replaces the Python loop over lines.
+
+    :return: Tuple of (content, line count, list of imports).
+    """
+    with mmap.mmap(f_raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        content = str(mapped, 'utf-8')
+    # Same newline translation as reading in text mode
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    line_count = content.count('\n') + (not content.endswith('\n') and bool(content))
+    imports = regex.findall(content) if regex is not None else []
+    return content, line_count, imports
+
+
+def _read_source_file(file, file_path, relative_file_path, size, mtime):
+    """
+    Read one source file, counting its lines and import statements.
+
+    Kept at module level so it can run in a process pool.
+
+    :return: Tuple of (project_sources entry, list of imports), or (None, None) if the file
+        could not be read.
+    """
+    try:
+        extension = _extension(file)
+        regex = _IMPORT_PATTERNS.get(extension)
+        with open(file_path, 'rb') as f_raw:
+            if hasattr(os, 'posix_fadvise'):
+                # The whole file is read front to back; let the kernel read ahead aggressively
+                os.posix_fadvise(f_raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            # A NUL byte early on marks a binary file, whatever its extension
+            if b'\x00' in f_raw.read(4096):
+                print(f"Skipping file {file_path}: looks like a binary file")
+                return None, None
+            f_raw.seek(0)
+            if size > _MMAP_THRESHOLD:
+                content, line_count, imports = _scan_mapped(f_raw, regex)
+            else:
+                content, line_count, imports = _scan_lines(f_raw, regex, _IMPORT_PREFIXES.get(extension))
+
+        source_data = {
+            'file': {
+                'File': file,
+                'Full Path': file_path,
+                'Relative Path': relative_file_path,
+                'Size': size,
+                'Last Modified': datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S'),
+                'Lines': line_count,
+                'Source_Code': content
+            }
+        }
+        return source_data, imports
+
+    except UnicodeDecodeError as e:
+        print(f"Skipping file {file_path} due to decoding error: {e}")
+    except Exception as e:
+        print(f"Skipping file {file_path} due to an unexpected error: {e}")
+    return None, None
+
+
+def _copy_range(src_fd, dst_fd, offset, count):
+    """
+    Copy count bytes starting at offset from src_fd to the current position of dst_fd.
+
+    Uses os.sendfile so the data stays in the kernel, falling back to plain reads and writes
+    where sendfile is missing or cannot write to a regular file.
+    """
+    if hasattr(os, 'sendfile'):
+        try:
+            while count:
+                sent = os.sendfile(dst_fd, src_fd, offset, count)
+                if not sent:
+                    return
+                offset += sent
+                count -= sent
+            return
+        except OSError:
+            pass
+
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    while count:
+        data = os.read(src_fd, min(count, 1024 * 1024))
+        if not data:
+            return
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view):]
+        count -= len(data)
+
+
+def _byte_at(fd, position):
+    if hasattr(os, 'pread'):
+        return os.pread(fd, 1, position)[0]
+    os.lseek(fd, position, os.SEEK_SET)
+    return os.read(fd, 1)[0]
+
+
+def _utf8_boundary(src_fd, position, start, size):
+    """
+    Move a chunk boundary off UTF-8 continuation bytes so no character is split across parts.
+    """
+    end = position
+    while start < end < size and (_byte_at(src_fd, end) & 0xC0) == 0x80:
+        end -= 1
+    if end > start:
+        return end
+    # The chunk is smaller than one character, so extend it past the character instead
+    end = position
+    while end < size and (_byte_at(src_fd, end) & 0xC0) == 0x80:
+        end += 1
+    return end
+
 
 class ProjectContextGenerator:
     def __init__(self, config):
         self.root_dir = config['root_dir']
         self.avoid_folders = config['avoid_folders']
+        self._avoid_folders_set = set(self.avoid_folders)
         self.avoid_files = set(config.get('avoid_files', []))
         self.include_extensions = set(config['include_extensions'])
+        self._include_ext_set = frozenset(self.include_extensions)
         self.key_files = config['key_files']
+        self._key_files_set = frozenset(self.key_files)
+        self._accepted_names = {}
         self.output_file = config['output_file']
         self.compress = config['compress']
         self.amount_of_chunks = config['amount_of_chunks']
         self.size_of_chunk = config['size_of_chunk']
-        self.imports = defaultdict(int)
+        # 'threads' overlaps file reads, 'processes' also parallelizes the import matching,
+        # None reads the files one by one
+        self.max_file_size_bytes = config.get('max_file_size_bytes', 2 * 1024 * 1024)
+        self.executor = config.get('executor', 'threads')
+        cpu_count = os.cpu_count() or 1
+        self.workers = config.get('workers') or (cpu_count if self.executor == 'processes' else min(32, cpu_count * 4))
+        self.imports = Counter()
         self.project_name = os.path.basename(self.root_dir)
-        self.language_extensions = {
-            'python': ['.py'],
-            'javascript': ['.js', '.mjs', '.jsx'],
-            'typescript': ['.ts', '.tsx'],
-            'java': ['.java'],
-            'csharp': ['.cs', '.csproj'],
-            'cpp': ['.cpp', '.hpp', '.h', '.cc'],
-            'c': ['.c', '.h'],
-            'ruby': ['.rb', '.erb', '.rake'],
-            'php': ['.php', '.phtml', '.php3', '.php4', '.php5', '.phps'],
-            'swift': ['.swift'],
-            'kotlin': ['.kt', '.kts'],
-            'go': ['.go'],
-            'r': ['.R', '.r'],
-            'perl': ['.pl', '.pm', '.t'],
-            'bash': ['.sh', '.bash'],
-            'html': ['.html', '.htm'],
-            'css': ['.css', '.scss', '.sass', '.less'],
-            'sql': ['.sql'],
-            'scala': ['.scala', '.sc'],
-            'haskell': ['.hs', '.lhs'],
-            'lua': ['.lua'],
-            'rust': ['.rs'],
-            'dart': ['.dart'],
-            'matlab': ['.m'],
-            'julia': ['.jl'],
-            'vb': ['.vb', '.vbs'],
-            'asm': ['.asm', '.s'],
-            'fsharp': ['.fs', '.fsi', '.fsx'],
-            'groovy': ['.groovy', '.gvy', '.gy', '.gsh'],
-            'erlang': ['.erl', '.hrl'],
-            'elixir': ['.ex', '.exs'],
-            'cobol': ['.cob', '.cbl'],
-            'fortran': ['.f', '.for', '.f90', '.f95'],
-            'ada': ['.adb', '.ads'],
-            'prolog': ['.pl', '.pro', '.P'],
-            'lisp': ['.lisp', '.lsp'],
-            'scheme': ['.scm', '.ss'],
-            'racket': ['.rkt'],
-            'verilog': ['.v', '.vh'],
-            'vhdl': ['.vhdl', '.vhd'],
-            'markdown': ['.md', '.markdown'],
-            'vue': ['.vue'],
-            'svelte': ['.svelte'],
-            'json': ['.json'],
-            'yaml': ['.yaml', '.yml'],
-            'xml': ['.xml'],
-            'git': ['.gitignore', '.gitattributes'],
-            'cicd': ['.travis.yml', 'Jenkinsfile', '.circleci/config.yml', '.gitlab-ci.yml', 'azure-pipelines.yml']
-        }
+        self.language_extensions = _LANGUAGE_EXTENSIONS
         self.detected_language = None
 
     def exclude_directories(self, dirs):
@@ -77,126 +325,198 @@ class ProjectContextGenerator:
         return [d for d in dirs if d not in exclude_set]
 
     def detect_programming_language(self, file):
-        for language, extensions in self.language_extensions.items():
-            if file.endswith(tuple(extensions)):
-                return language
-        return None
+        return _EXT_TO_LANG.get(_extension(file)) or _NAME_TO_LANG.get(file)
+
+    def _accept(self, name):
+        """
+        Whether a file belongs in the context: a key file, or one with an included extension.
+
+        Included entries that are whole names rather than extensions, such as 'Jenkinsfile',
+        match the full file name. Results are kept per name: names like '__init__.py' or
+        'index.js' repeat throughout a project, so most files cost a single dict lookup.
+        """
+        accepted = self._accepted_names.get(name)
+        if accepted is None:
+            accepted = self._accepted_names[name] = (
+                name in self._key_files_set or
+                _extension(name) in self._include_ext_set or
+                name in self._include_ext_set
+            )
+        return accepted
+
+    def _scan(self, path, rel_dir=''):
+        """
+        Walk a directory tree top-down with os.scandir, skipping avoided folders.
+
+        Yields (directory path relative to the walk's root, list of os.DirEntry for its files)
+        per directory, the root itself being ''. Relative paths are built up during the walk
+        instead of calling os.path.relpath. Like os.walk, symlinked directories are listed but
+        not descended into and unreadable ones are skipped.
+        """
+        files = []
+        dirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        files.append(entry)
+                    elif entry.name not in self._avoid_folders_set:
+                        dirs.append(entry)
+        except OSError:
+            return
+
+        yield rel_dir, files
+        for entry in dirs:
+            if not entry.is_symlink():
+                yield from self._scan(entry.path, f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name)
+
+    def _add_to_tree(self, nodes, rel_dir, files):
+        """
+        Add one scanned directory and its accepted files to the tree.
+
+        :param nodes: Tree nodes by relative directory path, '' being the tree itself.
+            _scan is top-down, so a directory's parent node is always present already.
+        :return: The os.DirEntry objects of the accepted files.
+        """
+        subdir = nodes.get(rel_dir)
+        if subdir is None:
+            parent, _, name = rel_dir.rpartition(os.sep)
+            subdir = {"directory_name": name, "children": []}
+            nodes[parent]["children"].append(subdir)
+            nodes[rel_dir] = subdir
+        accepted = []
+        for entry in files:
+            file = entry.name
+            if self._accept(file):
+                subdir["children"].append({"file_name": file})
+                accepted.append(entry)
+        return accepted
 
     def build_tree_structure(self, root_dir):
         tree = {"directory_name": os.path.basename(root_dir), "children": []}
-        for root, dirs, files in os.walk(root_dir):
-            dirs[:] = self.exclude_directories(dirs)
-            path = os.path.relpath(root, root_dir).split(os.sep)
-            subdir = tree
-            for part in path:
-                if part == '.':
-                    continue
-                for child in subdir["children"]:
-                    if child.get("directory_name") == part:
-                        subdir = child
-                        break
-                else:
-                    new_dir = {"directory_name": part, "children": []}
-                    subdir["children"].append(new_dir)
-                    subdir = new_dir
-            for file in files:
-                if file.endswith(tuple(self.include_extensions)) or file in self.key_files:
-                    subdir["children"].append({"file_name": file})
+        nodes = {'': tree}
+        for rel_dir, files in self._scan(root_dir):
+            self._add_to_tree(nodes, rel_dir, files)
         return tree
 
     def extract_imports(self, content, extension):
-        patterns = {
-            ".py": r"^\s*(?:import|from)\s+([\w\.]+)",
-            ".js": r"^\s*import\s+.*?\s+from\s+['\"]([\w\-\/]+)['\"]",
-            ".java": r"^\s*import\s+([\w\.]+)",
-            ".cpp": r"^\s*#\s*include\s*<([\w\.\/]+)>",
-            ".c": r"^\s*#\s*include\s*<([\w\.\/]+)>",
-            ".cs": r"^\s*using\s+([\w\.]+)",
-            ".rb": r"^\s*require\s+['\"]([\w\/]+)['\"]",
-            ".php": r"^\s*use\s+([\w\\]+)",
-            ".go": r"^\s*import\s+['\"]([\w\/]+)['\"]",
-            ".rs": r"^\s*extern\s+crate\s+([\w_]+)",
-            ".dart": r"^\s*import\s+['\"]([\w\/]+)['\"]",
-            ".ts": r"^\s*import\s+.*?\s+from\s+['\"]([\w\-\/]+)['\"]",
-            ".swift": r"^\s*import\s+([\w]+)",
-            ".kt": r"^\s*import\s+([\w\.]+)"
-        }
-
-        pattern = patterns.get(extension)
-        if not pattern:
+        regex = _IMPORT_PATTERNS.get(extension)
+        if regex is None:
             return []
 
-        regex = re.compile(pattern, re.MULTILINE)
         matches = regex.findall(content)
-        for match in matches:
-            self.imports[match] += 1
+        self.imports.update(matches)
         return matches
 
+    def _read_sources(self, sources):
+        """
+        Read source files with the configured executor, yielding results in input order.
+
+        At most two files per worker are in flight, so results are written out as they come
+        instead of piling up in memory.
+
+        :param sources: Argument tuples for _read_source_file.
+        """
+        if self.executor is None or self.workers <= 1:
+            for args in sources:
+                yield _read_source_file(*args)
+            return
+
+        pool_class = ProcessPoolExecutor if self.executor == 'processes' else ThreadPoolExecutor
+        with pool_class(max_workers=self.workers) as pool:
+            pending = deque()
+            for args in sources:
+                pending.append(pool.submit(_read_source_file, *args))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def _write_json_member(f_out, key, value, last=False):
+        # Same layout as one indented dump of the whole object, for a top-level member
+        encoded = _dumps(value).replace(b'\n', b'\n' + _JSON_INDENT)
+        f_out.write(_JSON_INDENT + _dumps(key) + b': ' + encoded + (b'\n' if last else b',\n'))
+
     def generate_context_file(self):
         print(f"Generating context file: {self.output_file}")
-        project_data = {
-            'project_name': self.project_name,
-            'programming_language': '',  # Will be detected later
-            'project_tree_structure': self.build_tree_structure(self.root_dir),
-            'project_sources': [],
-            'external_libraries': [],
-            'observations': []
-        }
-
-        for root, dirs, files in os.walk(self.root_dir, topdown=True):
-            dirs[:] = self.exclude_directories(dirs)
-            if files:
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    relative_file_path = os.path.relpath(file_path, self.root_dir)
-                    if (
-                        (file.endswith(tuple(self.include_extensions)) or file in self.key_files) and
-                        file not in self.avoid_files and
-                        relative_file_path not in self.avoid_files
-                    ):
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f_in:
-                                content = f_in.read()
-                                file_info = os.stat(file_path)
-                                source_data = {
-                                    'file': {
-                                        'File': file,
-                                        'Full Path': file_path,
-                                        'Relative Path': relative_file_path,
-                                        'Size': file_info.st_size,
-                                        'Last Modified': datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                                        'Lines': len(content.splitlines()),
-                                        'Source_Code': content
-                                    }
-                                }
-                                project_data['project_sources'].append(source_data)
-
-                                extension = os.path.splitext(file)[1]
-                                self.extract_imports(content, extension)
-
-                                # Detect programming language
-                                if not self.detected_language:
-                                    self.detected_language = self.detect_programming_language(file)
-
-                        except UnicodeDecodeError as e:
-                            print(f"Skipping file {file_path} due to decoding error: {e}")
-                        except Exception as e:
-                            print(f"Skipping file {file_path} due to an unexpected error: {e}")
-
-        project_data['programming_language'] = self.detected_language or 'unknown'
-        project_data['external_libraries'] = [{"import_name": imp, "count": count} for imp, count in self.imports.items()]
-
-        if not self.imports:
-            project_data['observations'].append("No external libraries or imports were detected in the source code.")
+        # The tree and the list of sources are collected in the same directory walk
+        tree = {"directory_name": os.path.basename(self.root_dir), "children": []}
+        nodes = {'': tree}
+        sources = []
+        # Detect programming language from the first source that has one; it is
+        # written before the sources are read
+        detected = self.detected_language
+        for rel_dir, files in self._scan(self.root_dir):
+            dir_sources = []
+            for entry in self._add_to_tree(nodes, rel_dir, files):
+                relative_file_path = f"{rel_dir}{os.sep}{entry.name}" if rel_dir else entry.name
+                if entry.name not in self.avoid_files and relative_file_path not in self.avoid_files:
+                    try:
+                        # DirEntry caches the stat result
+                        file_info = entry.stat()
+                    except OSError as e:
+                        print(f"Skipping file {entry.path} due to an unexpected error: {e}")
+                        continue
+                    if file_info.st_size > self.max_file_size_bytes:
+                        print(f"Skipping file {entry.path}: {file_info.st_size} bytes exceeds the {self.max_file_size_bytes} byte limit")
+                        continue
+                    dir_sources.append((file_info.st_ino, (entry.name, entry.path, relative_file_path, file_info.st_size, file_info.st_mtime)))
+                    if detected is None:
+                        detected = self.detect_programming_language(entry.name)
+            # Read each directory's files in inode order, which usually follows their layout on
+            # disk; the sort is stable, so it is a no-op where st_ino is 0 (DirEntry on Windows)
+            dir_sources.sort(key=lambda source: source[0])
+            sources.extend(source for _, source in dir_sources)
+        self.detected_language = detected
 
         # Ensure the output directory exists
         output_dir = os.path.dirname(self.output_file)
         os.makedirs(output_dir, exist_ok=True)
 
-        with open(self.output_file, 'w', encoding='utf-8') as f_out:
-            json.dump(project_data, f_out, indent=4)
-
-        os.chmod(self.output_file, 0o666)
+        # Sources are written as they are read, so only one file's content is held at a time.
+        # The output matches a single indented dump of the whole project data. A 1 MiB buffer
+        # over the raw descriptor turns the many small pieces into few large os.write calls.
+        fd = os.open(self.output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        with open(fd, 'wb', buffering=1024 * 1024) as f_out:
+            f_out.write(b'{\n')
+            self._write_json_member(f_out, 'project_name', self.project_name)
+            self._write_json_member(f_out, 'programming_language', self.detected_language or 'unknown')
+            self._write_json_member(f_out, 'project_tree_structure', tree)
+
+            item_indent = _JSON_INDENT * 2
+            f_out.write(_JSON_INDENT + b'"project_sources": [')
+            written = 0
+            for source_data, imports in self._read_sources(sources):
+                if source_data is None:
+                    continue
+                self.imports.update(imports)
+                f_out.write(b',\n' if written else b'\n')
+                f_out.write(item_indent + _dumps(source_data).replace(b'\n', b'\n' + item_indent))
+                written += 1
+            f_out.write(b'\n' + _JSON_INDENT + b'],\n' if written else b'],\n')
+
+            external_libraries = [{"import_name": imp, "count": count} for imp, count in self.imports.items()]
+            observations = []
+            if not self.imports:
+                observations.append("No external libraries or imports were detected in the source code.")
+            self._write_json_member(f_out, 'external_libraries', external_libraries)
+            self._write_json_member(f_out, 'observations', observations, last=True)
+            f_out.write(b'}')
+
+            # One fsync once everything is written
+            f_out.flush()
+            os.fsync(fd)
+            # The mode passed to os.open is reduced by the umask
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, 0o666)
+
+        if not hasattr(os, 'fchmod'):
+            os.chmod(self.output_file, 0o666)
         print(f"Context file generated at: {self.output_file}")
 
     def split_file(self, file_path, num_chunks=None, chunk_size=None):
@@ -204,22 +524,46 @@ class ProjectContextGenerator:
         os.makedirs(output_dir, exist_ok=True)
         print(f"Splitting file {file_path} into parts in directory {output_dir}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        if num_chunks:
-            chunk_size = len(content) // num_chunks + (len(content) % num_chunks > 0)
-
-        chunk_size = chunk_size or len(content)
-        part_num = 0
-
-        for i in range(0, len(content), chunk_size):
-            part_filename = os.path.join(output_dir, f"{os.path.basename(file_path)}.part{part_num}")
-            with open(part_filename, 'w', encoding='utf-8') as part_file:
-                part_file.write(content[i:i + chunk_size])
-            os.chmod(part_filename, 0o666)
-            print(f"Created part file: {part_filename}")
-            part_num += 1
+        # Copied as bytes between file descriptors; boundaries are moved so no UTF-8
+        # character is split
+        binary = getattr(os, 'O_BINARY', 0)
+        src_fd = os.open(file_path, os.O_RDONLY | binary)
+        try:
+            size = os.fstat(src_fd).st_size
+
+            # Work out every part's byte range before copying anything
+            ranges = []
+            offset = 0
+            if num_chunks:
+                # Part i ends at the first character start after (i + 1) / num_chunks of the
+                # file, so moving a boundary never adds a part; empty ranges are dropped
+                for i in range(num_chunks):
+                    end = _utf8_boundary(src_fd, max((i + 1) * size // num_chunks, offset), offset, size)
+                    if end > offset:
+                        ranges.append((offset, end - offset))
+                        offset = end
+            else:
+                chunk_size = chunk_size or size
+                while offset < size:
+                    end = _utf8_boundary(src_fd, min(offset + chunk_size, size), offset, size)
+                    ranges.append((offset, end - offset))
+                    offset = end
+
+            for part_num, (offset, length) in enumerate(ranges):
+                part_filename = os.path.join(output_dir, f"{os.path.basename(file_path)}.part{part_num}")
+                dst_fd = os.open(part_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | binary, 0o666)
+                try:
+                    _copy_range(src_fd, dst_fd, offset, length)
+                    # The mode passed to os.open is reduced by the umask
+                    if hasattr(os, 'fchmod'):
+                        os.fchmod(dst_fd, 0o666)
+                finally:
+                    os.close(dst_fd)
+                if not hasattr(os, 'fchmod'):
+                    os.chmod(part_filename, 0o666)
+                print(f"Created part file: {part_filename}")
+        finally:
+            os.close(src_fd)
 
         new_output_file_path = os.path.join(output_dir, os.path.basename(file_path))
         os.rename(file_path, new_output_file_path)
@@ -264,7 +608,10 @@ def main(
     output_folder='./context',
     compress=0,
     amount_of_chunks=10,
-    size_of_chunk=None
+    size_of_chunk=None,
+    executor='threads',
+    workers=None,
+    max_file_size_bytes=2 * 1024 * 1024
 ):
     # Combine common avoid folders with additional avoid folders
     avoid_folders = COMMON_AVOID_FOLDERS + additional_avoid_folders
@@ -273,23 +620,6 @@ def main(
     avoid_files = COMMON_AVOID_FILES + additional_avoid_files
     avoid_files_set = set(avoid_files)
 
-    # Create a temporary instance of ProjectContextGenerator to access the language_extensions
-    temp_config = {
-        "root_dir": root_dir,
-        "avoid_folders": avoid_folders,
-        "avoid_files": avoid_files_set,
-        "include_extensions": [],
-        "key_files": [],
-        "output_file": "",
-        "compress": 0,
-        "amount_of_chunks": 0,
-        "size_of_chunk": 0,
-    }
-    temp_generator = ProjectContextGenerator(temp_config)
-    language_extensions = set()
-    for extensions in temp_generator.language_extensions.values():
-        language_extensions.update(extensions)
-
     # Get current timestamp in the format '-YYYYMMDDHHMMSS'
     timestamp = datetime.now().strftime("-%Y%m%d%H%M%S")
 
@@ -307,12 +637,15 @@ def main(
         "root_dir": root_dir,
         "avoid_folders": avoid_folders,
         "avoid_files": avoid_files_set,
-        "include_extensions": list(language_extensions),
-        "key_files": temp_generator.key_files,  # Using existing key files from the class
+        "include_extensions": list(_FLAT_EXT_SET),
+        "key_files": [],
         "output_file": output_file_with_timestamp,
         "compress": compress,
         "amount_of_chunks": amount_of_chunks,
         "size_of_chunk": size_of_chunk,
+        "executor": executor,
+        "workers": workers,
+        "max_file_size_bytes": max_file_size_bytes,
     }
 
     generator = ProjectContextGenerator(config)
@@ -348,6 +681,9 @@ if __name__ == "__main__":
     parser.add_argument("--compress", type=int, choices=[0, 1], default=1, help="Whether to compress the output (0 or 1, default: 1)")
     parser.add_argument("--amount-of-chunks", type=int, default=10, help="Number of chunks to split the file into (default: 10)")
     parser.add_argument("--size-of-chunk", type=int, help="Size of each chunk in bytes")
+    parser.add_argument("--executor", choices=["threads", "processes", "serial"], default="threads", help="How source files are read: a thread pool, a process pool or one by one (default: threads)")
+    parser.add_argument("--max-file-size", type=int, default=2 * 1024 * 1024, help="Skip source files larger than this many bytes (default: 2 MiB)")
+    parser.add_argument("--workers", type=int, help="Number of pool workers (default: depends on the executor)")
 
     args = parser.parse_args()
 
@@ -359,5 +695,8 @@ if __name__ == "__main__":
         output_folder=args.output_folder,
         compress=args.compress,
         amount_of_chunks=args.amount_of_chunks,
-        size_of_chunk=args.size_of_chunk
+        size_of_chunk=args.size_of_chunk,
+        executor=None if args.executor == "serial" else args.executor,
+        workers=args.workers,
+        max_file_size_bytes=args.max_file_size
     )
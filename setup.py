@@ -14,10 +14,13 @@ setup(
         'requests>=2.25.1',
         'brainboost_configuration_package'
     ],
+    extras_require={
+        'fast': ['orjson'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
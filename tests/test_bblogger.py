@@ -3,14 +3,72 @@ from brainboost_data_source_logger_package.BBLogger import BBLogger
 from brainboost_configuration_package.BBConfig import BBConfig
 import random
 import string
-from datetime import datetime, timedelta
+from datetime import datetime
 import os
+import numpy as np
+import shutil
+from types import SimpleNamespace
 
-def random_message(length=50):
-    """Generate a random string of fixed length."""
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+try:
+    import pytest_benchmark
+except ImportError:
+    pytest_benchmark = None
 
-def test_bblogger_inserts_millions_of_logs():
+def reset_log_directory(log_path):
+    """Start from an empty log directory, removing it in one tree walk."""
+    shutil.rmtree(log_path, ignore_errors=True)
+    os.makedirs(log_path, exist_ok=True)
+
+# Formatting whole frames with to_string is slow; only do it when BB_VERBOSE is set
+VERBOSE = bool(os.environ.get('BB_VERBOSE'))
+
+# Insert volume, raised through BB_NUM_LOGS for scaling runs
+NUM_LOGS = int(os.environ.get('BB_NUM_LOGS', 10_000))
+
+# With pytest-benchmark installed, the insert is timed over this many rounds
+BENCHMARK_ROUNDS = 3
+
+def benchmark_group(name):
+    """Mark a test for pytest-benchmark when the plugin is installed."""
+    return pytest.mark.benchmark(group=name) if pytest_benchmark is not None else (lambda test: test)
+
+ALPHABET = np.frombuffer((string.ascii_letters + string.digits).encode('ascii'), dtype=np.uint8)
+
+def random_messages(count, length=50):
+    """Generate count random strings of fixed length from a single NumPy draw."""
+    indices = np.random.randint(0, len(ALPHABET), size=(count, length), dtype=np.uint8)
+    corpus = ALPHABET[indices].tobytes()
+    return [corpus[i * length:(i + 1) * length].decode('ascii') for i in range(count)]
+
+@pytest.fixture(scope="module")
+def today_str():
+    """Today's date in the log file name format, computed once for the module."""
+    return datetime.now().strftime('%Y_%m_%d')
+
+@pytest.fixture(scope="module")
+def log_file_path(today_str):
+    """Path of today's log file."""
+    return os.path.join(BBConfig.get('log_path'), f"{BBConfig.get('log_prefix')}_log_{today_str}.log")
+
+@pytest.fixture(scope="module")
+def log_view(log_file_path):
+    """Row and page counts of today's log file, read once for every test that needs them."""
+    if not os.path.exists(log_file_path):
+        pytest.skip(f"Log file for today does not exist: {log_file_path}")
+
+    # Count rows over 1 MiB binary chunks; unlike a mapping this also works on an empty file
+    with open(log_file_path, 'rb', buffering=1 << 20) as log_file:
+        total_lines = sum(chunk.count(b'\n') for chunk in iter(lambda: log_file.read(1 << 20), b'')) - 1  # Exclude header row
+    page_size = BBConfig.get('log_page_size')
+    return SimpleNamespace(
+        path=log_file_path,
+        page_size=page_size,
+        total_lines=total_lines,
+        total_pages=(total_lines + page_size - 1) // page_size
+    )
+
+@benchmark_group("insert")
+def test_bblogger_inserts_millions_of_logs(request):
     """Test BBLogger by inserting a couple of million log lines."""
 
     # Override configuration settings for testing
@@ -26,27 +84,32 @@ def test_bblogger_inserts_millions_of_logs():
     assert BBConfig.get('log_enable_files')
     assert not BBConfig.get('log_enable_database')
 
-    num_logs = 10_000  # Reduced number of logs for testing
-    for i in range(num_logs):
-        message = f"Test log {i}: {random_message()}"
-        BBLogger.log(message)
+    # Apply the overrides and close any log file before its directory is replaced
+    BBLogger.refresh_config()
+    reset_log_directory(BBConfig.get('log_path'))
+
+    # map() runs the bound str.format in C instead of resuming a generator frame per message
+    messages = list(map("Test log {}: {}".format, range(NUM_LOGS), random_messages(NUM_LOGS)))
+
+    def insert():
+        # One call hands every message to the sinks as a single batch; waiting for the
+        # background writer includes the file I/O and lets the following tests find the rows
+        BBLogger.log_many(messages)
+        BBLogger.flush()
 
-def test_read_random_pages():
+    if pytest_benchmark is not None:
+        request.getfixturevalue('benchmark').pedantic(insert, rounds=BENCHMARK_ROUNDS)
+    else:
+        insert()
+
+def test_read_random_pages(log_view):
     """Test reading random pages from the current log file using BBLogger.get_page."""
     print("Testing BBLogger.get_page:")
-    page_size = BBConfig.get('log_page_size')
-    log_path = BBConfig.get('log_path')
-    current_date = datetime.now().strftime('%Y_%m_%d')
-    log_file_path = os.path.join(log_path, f"{BBConfig.get('log_prefix')}_log_{current_date}.log")
-
-    print(f"Log file path: {log_file_path}")
-    if not os.path.exists(log_file_path):
-        pytest.skip(f"Log file for today does not exist: {log_file_path}")
+    page_size = log_view.page_size
+    total_pages = log_view.total_pages
 
-    with open(log_file_path, 'r', encoding='utf-8') as log_file:
-        total_lines = sum(1 for _ in log_file) - 1  # Exclude header row
-        total_pages = (total_lines + page_size - 1) // page_size
-        print(f"Total lines: {total_lines}, Total pages: {total_pages}")
+    print(f"Log file path: {log_view.path}")
+    print(f"Total lines: {log_view.total_lines}, Total pages: {total_pages}")
 
     for _ in range(3):
         page_num = random.randint(1, total_pages)
@@ -54,38 +117,44 @@ def test_read_random_pages():
 
         start_index = (page_num - 1) * page_size + 1
         end_index = start_index + len(page) - 1
-        print(f"\n--- Page {page_num} (Rows {start_index} to {end_index}) ---")
-        print(page.to_string(index=False))
+        if VERBOSE:
+            print(f"\n--- Page {page_num} (Rows {start_index} to {end_index}) ---")
+            print(page.to_string(index=False))
         assert len(page) <= page_size
 
-def test_get_logs_in_range():
+def test_get_logs_in_range(today_str):
     """Test retrieving logs within a specific range."""
     print("Testing BBLogger.get_logs_in_range:")
-    current_date = datetime.now().strftime('%Y_%m_%d')
     start_line = 1
     end_line = 50
-    logs = BBLogger.get_logs_in_range(current_date, start_line, end_line)
-    print(logs.to_string(index=False))
+    logs = BBLogger.get_logs_in_range(today_str, start_line, end_line)
+    if VERBOSE:
+        print(logs.to_string(index=False))
     assert not logs.empty
     assert len(logs) == (end_line - start_line + 1)
 
 def test_get_logs_between_timestamps():
     """Test retrieving logs between two timestamps."""
     print("Testing BBLogger.get_logs_between_timestampt_and_timestampt:")
-    t1 = datetime.now().strftime('%Y%m%d%H%M%S')
-    t2 = (datetime.now() + timedelta(minutes=5)).strftime('%Y%m%d%H%M%S')
+    # Epoch seconds, starting early enough to cover the rows written by the insert test
+    t1 = int(datetime.now().timestamp()) - 300
+    t2 = t1 + 600
     logs = BBLogger.get_logs_between_timestampt_and_timestampt(t1, t2)
-    print(logs.to_string(index=False))
+    if VERBOSE:
+        print(logs.to_string(index=False))
     assert not logs.empty
-    assert all(t1 <= ts <= t2 for ts in logs['timestamp'])
+    # The returned timestamps are datetime64, so the bounds are compared as datetime64 too
+    start, end = (np.datetime64(datetime.fromtimestamp(t)) for t in (t1, t2))
+    timestamps = logs['timestamp'].to_numpy()
+    assert np.logical_and(timestamps >= start, timestamps <= end).all()
 
-def test_get_total_amount_of_pages():
+def test_get_total_amount_of_pages(today_str, log_view):
     """Test retrieving the total number of pages in the log file."""
     print("Testing BBLogger.get_total_amount_of_pages:")
-    current_date = datetime.now().strftime('%Y_%m_%d')
-    total_pages = BBLogger.get_total_amount_of_pages(current_date)
+    total_pages = BBLogger.get_total_amount_of_pages(today_str)
     print(f"Total pages: {total_pages}")
     assert total_pages > 0
+    assert total_pages == log_view.total_pages
 
 if __name__ == "__main__":
     pytest.main(["-v", "test_bblogger.py"])
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+import pytest
+
+import context
+
+
+def make_generator(root_dir, output_file):
+    """Build a ProjectContextGenerator with the configuration main() would use."""
+    return context.ProjectContextGenerator({
+        "root_dir": str(root_dir),
+        "avoid_folders": context.COMMON_AVOID_FOLDERS,
+        "avoid_files": set(context.COMMON_AVOID_FILES),
+        "include_extensions": list(context._FLAT_EXT_SET),
+        "key_files": [],
+        "output_file": str(output_file),
+        "compress": 0,
+        "amount_of_chunks": 10,
+        "size_of_chunk": None,
+    })
+
+@pytest.mark.skipif(sys.platform in ('win32', 'darwin'), reason="file names must be arbitrary bytes")
+def test_generate_context_file_with_non_utf8_file_name(tmp_path):
+    """A file name that is not valid UTF-8 still produces a complete context file."""
+    root_dir = tmp_path / "project"
+    root_dir.mkdir()
+    try:
+        with open(os.path.join(os.fsencode(root_dir), b'caf\xe9.py'), 'w') as f:
+            f.write("import os\n")
+    except OSError:
+        pytest.skip("file system does not accept non-UTF-8 file names")
+
+    output_file = tmp_path / "out" / "snapshot.json"
+    make_generator(root_dir, output_file).generate_context_file()
+
+    with open(output_file, encoding='utf-8') as f:
+        data = json.load(f)
+    assert [child['file_name'] for child in data['project_tree_structure']['children']] == [os.fsdecode(b'caf\xe9.py')]
+    assert len(data['project_sources']) == 1
+
+@pytest.mark.parametrize("size", [1, 9, 10, 37, 390, 1001])
+def test_split_file_keeps_part_count_on_non_ascii_content(tmp_path, size):
+    """Splitting UTF-8 content into num_chunks parts never yields more parts, and the parts rejoin losslessly."""
+    content = ("aé€😀" * size).encode('utf-8')[:size * 3]
+    content = content.decode('utf-8', errors='ignore').encode('utf-8')
+    file_path = tmp_path / "snapshot.json"
+    file_path.write_bytes(content)
+
+    generator = make_generator(tmp_path, file_path)
+    output_dir = generator.split_file(str(file_path), num_chunks=10)
+
+    parts = sorted(
+        (name for name in os.listdir(output_dir) if '.part' in name),
+        key=lambda name: int(name.rsplit('.part', 1)[1])
+    )
+    assert 1 <= len(parts) <= 10
+    data = [open(os.path.join(output_dir, name), 'rb').read() for name in parts]
+    assert b''.join(data) == content
+    for part in data:
+        part.decode('utf-8')